@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Build a frozen tarball-installer bundle with PyInstaller.
+
+Requires PyInstaller (pip install pyinstaller). The result lands in
+dist/tarball-installer/. --onedir is used on purpose: --onefile unpacks
+itself to a temporary directory on every launch, which costs more than
+the frozen imports save.
+"""
+import os
+
+import PyInstaller.__main__
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def main():
+    PyInstaller.__main__.run([
+        os.path.join(HERE, "src", "tarball_installer", "__main__.py"),
+        "--onedir",
+        "--windowed",
+        "--noconfirm",
+        "--name=tarball-installer",
+        f"--paths={os.path.join(HERE, 'src')}",
+        f"--specpath={os.path.join(HERE, 'build')}",
+        # Resolved lazily through tarball_installer.__getattr__, so the
+        # import scanner cannot see it
+        "--hidden-import=tarball_installer.main_window",
+        "--hidden-import=PySide6.QtWidgets",
+    ])
+
+if __name__ == "__main__":
+    main()
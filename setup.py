@@ -1,39 +1,35 @@
-from setuptools import setup, find_packages
-import os
+from setuptools import setup
+from setuptools.command.build_py import build_py
+import compileall
+import py_compile
+import sys
 
-# Read requirements from file
-with open('requirements.txt') as f:
-    requirements = f.read().splitlines()
 
+class build_py_compiled(build_py):
+    """Byte-compile the built package so the first launch skips compilation"""
+
+    def run(self):
+        super().run()
+        # Hash-based pycs stay valid when the wheel installer rewrites mtimes
+        compileall.compile_dir(
+            self.build_lib, quiet=1,
+            invalidation_mode=py_compile.PycInvalidationMode.CHECKED_HASH,
+        )
+
+
+def long_description():
+    """README contents, read only for commands that publish it"""
+    if not any(cmd in sys.argv for cmd in ("sdist", "bdist_wheel")):
+        return ""
+    try:
+        with open('README.md', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+# Static metadata and package layout live in pyproject.toml
 setup(
-    name="tarball-installer",
-    version="1.0.0",
-    author="Chief Denis",
-    author_email="your.email@example.com",
-    description="Install tarballs as native applications",
-    long_description=open('README.md').read() if os.path.exists('README.md') else "",
-    packages=find_packages(where="src"),
-    package_dir={"": "src"},
-    install_requires=requirements,
-    entry_points={
-        "gui_scripts": [
-            "tarball-installer=tarball_installer.main:main",
-        ],
-    },
-    data_files=[
-        ("share/applications", ["data/com.chiefdenis.tarballinstaller.desktop"]),
-        ("share/metainfo", ["data/com.chiefdenis.tarballinstaller.appdata.xml"]),
-        ("share/icons/hicolor/scalable/apps", ["data/icons/com.chiefdenis.tarballinstaller.svg"]),
-    ],
-    classifiers=[
-        "Development Status :: 3 - Alpha",
-        "Intended Audience :: End Users/Desktop",
-        "Topic :: System :: Installation/Setup",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-    ],
-    python_requires=">=3.10",
-)
\ No newline at end of file
+    cmdclass={"build_py": build_py_compiled},
+    long_description=long_description(),
+)
@@ -1,23 +0,0 @@
-#!/usr/bin/env python3
-import sys
-import os
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-
-from PySide6.QtWidgets import QApplication
-from main_window import MainWindow
-
-def main():
-    app = QApplication(sys.argv)
-    app.setApplicationName("Tarball Installer")
-    app.setOrganizationName("YourName")
-    
-    window = MainWindow()
-    window.show()
-    
-    sys.exit(app.exec())
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
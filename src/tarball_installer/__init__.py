@@ -0,0 +1,35 @@
+"""Tarball Installer - install tarballs as native applications"""
+import importlib
+import sys
+
+# Version constant at the top
+__version__ = "0.25.0"
+
+# Public names resolved on first access so importing the package stays Qt-free
+_LAZY = {
+    name: ("tarball_installer.main_window", name)
+    for name in (
+        "MainWindow",
+        "WelcomeDialog",
+        "InstallationLogDialog",
+        "ExtractThread",
+        "PreviewThread",
+        "InstallerThread",
+        "UninstallThread",
+        "InstallationTracker",
+        "InstallationsModel",
+    )
+}
+
+__all__ = ["__version__", *_LAZY]
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        setattr(sys.modules[__name__], name, value)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,4 @@
+# Absolute import so frozen builds can run this file as a plain script
+from tarball_installer.main import main
+
+main()
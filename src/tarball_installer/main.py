@@ -0,0 +1,75 @@
+import os
+import sys
+
+USAGE = """Usage: tarball-installer [--help] [--version]
+
+Install tarballs as native applications.
+
+Options:
+  -h, --help     Show this message and exit
+  --version      Show the version and exit"""
+
+def use_user_pycache():
+    """Cache bytecode under ~/.cache when the package directory is read-only"""
+    if sys.pycache_prefix is not None or sys.dont_write_bytecode:
+        return
+    
+    # Keep using bytecode the installer compiled, or that we can write ourselves
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if os.path.isdir(os.path.join(package_dir, "__pycache__")) or os.access(package_dir, os.W_OK):
+        return
+    
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    sys.pycache_prefix = os.path.join(cache_home, "tarball-installer", "pycache")
+
+def main():
+    # Answer --help/--version before paying for the Qt import
+    if len(sys.argv) > 1 and sys.argv[1] in ("--help", "-h", "--version"):
+        if sys.argv[1] == "--version":
+            from . import __version__
+            print(f"Tarball Installer {__version__}")
+        else:
+            print(USAGE)
+        return
+
+    use_user_pycache()
+    
+    import PySide6.QtWidgets as qtw
+    from PySide6.QtCore import Qt, QTimer
+    from PySide6.QtGui import QIcon, QPixmap
+
+    # An explicit built-in style lets Qt skip scanning the style plugin
+    # directories; the stylesheet supplies the look anyway
+    if "QT_STYLE_OVERRIDE" not in os.environ:
+        qtw.QApplication.setStyle("Fusion")
+    # Startup-cost attributes must be set before the QApplication exists
+    qtw.QApplication.setAttribute(Qt.ApplicationAttribute.AA_DontCreateNativeWidgetSiblings, True)
+    qtw.QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+    qtw.QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, False)
+    # No Qt command-line flags are forwarded, so spare Qt the argv scan
+    app = qtw.QApplication(sys.argv[:1])
+    app.setApplicationName("Tarball Installer")
+    app.setOrganizationName("YourName")
+    
+    # Put a cheap splash on screen, then build the real window once the
+    # event loop is running
+    pixmap = QIcon.fromTheme("application-x-tar").pixmap(128, 128)
+    if pixmap.isNull():
+        pixmap = QPixmap(128, 128)
+        pixmap.fill()
+    splash = qtw.QSplashScreen(pixmap)
+    splash.showMessage("Loading Tarball Installer...")
+    splash.show()
+    app.processEvents()
+    
+    windows = []
+    
+    def show_main_window():
+        from . import MainWindow
+        window = MainWindow()
+        windows.append(window)
+        window.show()
+        splash.finish(window)
+    
+    QTimer.singleShot(0, show_main_window)
+    sys.exit(app.exec())
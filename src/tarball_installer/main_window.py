@@ -0,0 +1,2636 @@
+from . import __version__
+from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+                              QPushButton, QLabel, QFileDialog, QTextEdit,
+                              QProgressBar, QMessageBox, QGroupBox, QTabWidget,
+                              QCheckBox, QSplitter,
+                              QStatusBar, QDialog, QDialogButtonBox,
+                              QRadioButton, QTreeView,
+                              QHeaderView, QScrollArea, QTableWidget,
+                              QTableWidgetItem, QAbstractItemView)
+from PySide6.QtCore import (Qt, QThread, QThreadPool, QRunnable, QTimer, Signal,
+                            QAbstractTableModel, QModelIndex)
+from PySide6.QtGui import QFont, QIcon, QAction
+import os
+import errno
+import json
+import stat
+from pathlib import Path
+import time
+import threading
+import queue
+from datetime import datetime
+from functools import lru_cache
+import re
+# subprocess, tempfile, hashlib and tarfile are imported where they are
+# used, so opening the window doesn't wait for them
+
+# Tracker and marker JSON goes through orjson when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Copy and read sizes for tarball extraction (the tarfile default is 16 KiB)
+TAR_COPY_BUFSIZE = 2 * 1024 * 1024
+TAR_READ_BUFSIZE = 1024 * 1024
+
+# Seconds a staged extraction may go unused before an install prunes it
+EXTRACTION_CACHE_MAX_AGE = 7 * 24 * 3600
+
+# System tar can't detect compression on stdin, so pick the flag from the magic bytes
+TAR_COMPRESSION_FLAGS = {
+    b'\x1f\x8b': '-z',
+    b'BZh': '-j',
+    b'\xfd7zXZ\x00': '-J',
+}
+
+# Multi-threaded drop-in decompressors, preferred over tar's built-in ones
+TAR_PARALLEL_DECOMPRESSORS = {
+    '-z': ('pigz',),
+    '-j': ('pbzip2', 'lbzip2'),
+    '-J': ('pixz',),
+}
+
+# ioctl request for a reflink copy (linux/fs.h)
+FICLONE = 0x40049409
+
+# Seconds between batched log signals from the installer thread
+LOG_FLUSH_INTERVAL = 0.25
+
+# Seconds between progress signals from the extraction and preview threads
+PROGRESS_INTERVAL = 0.05
+
+# Milliseconds the window collects log lines before appending them to a log view
+LOG_DISPLAY_INTERVAL_MS = 50
+
+# Lines a log view keeps before dropping the oldest
+LOG_MAX_BLOCKS = 2000
+
+# Minimum worker threads an install uses for its parallel file work
+INSTALL_WORKERS = 8
+
+# Milliseconds a cancelled install gets to stop on its own before it is terminated
+CANCEL_TIMEOUT_MS = 2000
+
+# Icon files worth installing, checked with a single str.endswith call
+ICON_EXTENSIONS = ('.png', '.svg', '.xpm', '.ico')
+
+# Table prefixes for the member kinds the analysis picks out
+KIND_PREFIXES = {'desktop': '📄', 'binary': '⚙️', 'icon': '🎨'}
+
+# Name fragments that mark a likely main executable
+MAIN_BINARY_NAMES = ('app', 'main', 'run', 'start', 'launch')
+
+# File dialog filters
+TARBALL_FILE_FILTER = "Tarball files (*.tar.gz *.tar.bz2 *.tgz *.tar.xz *.txz *.tar);;All files (*.*)"
+EXECUTABLE_FILE_FILTER = "Executable files (*);;All files (*.*)"
+
+# Turn a tarball filename into an application name
+TARBALL_SUFFIX_RE = re.compile(r'\.(tar\.gz|tar\.bz2|tar\.xz|tgz|tbz2|txz)$')
+NAME_SEPARATOR_RE = re.compile(r'[-_]')
+
+# Key=value lines of a desktop entry, with the spaces around "=" dropped
+DESKTOP_ENTRY_RE = re.compile(r'^[ \t]*([A-Za-z0-9-]+)[ \t]*=[ \t]*(.*?)[ \t]*\r?$', re.M)
+
+# Exec= lines in any group, rewritten to point at our launchers
+EXEC_LINE_RE = re.compile(r'^Exec=(.*)$', re.M)
+
+# Deleted with bytes.translate to count the non-ASCII bytes in a file header
+ASCII_BYTES = bytes(range(128))
+
+def walk_entries(path, max_depth=None):
+    """Yield a DirEntry for everything below path that isn't a directory.
+    
+    Like os.walk, a directory's own entries come before its subdirectories',
+    and symlinked directories are listed but not followed.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+        except OSError:
+            continue
+        yield entry
+    if max_depth is not None:
+        if max_depth <= 0:
+            return
+        max_depth -= 1
+    for subdir in subdirs:
+        yield from walk_entries(subdir, max_depth)
+
+def walk_files(path, max_depth=None):
+    """Yield a DirEntry for every regular file below path, skipping symlinks"""
+    for entry in walk_entries(path, max_depth):
+        try:
+            if entry.is_file(follow_symlinks=False):
+                yield entry
+        except OSError:
+            continue
+
+def load_json(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def dump_json(obj):
+    """Indented JSON as bytes, the way json.dump(obj, f, indent=2) writes it"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+@lru_cache(maxsize=512)
+def format_install_date(install_time):
+    """The day part of an ISO install_time, or the string unchanged if it doesn't parse"""
+    try:
+        return datetime.fromisoformat(install_time).strftime("%Y-%m-%d")
+    except (TypeError, ValueError):
+        return install_time
+
+def fast_copy(src, dst):
+    """Copy like shutil.copy2, cloning or copying in the kernel when possible"""
+    import fcntl
+    import shutil
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            try:
+                # Copy-on-write clone on Btrfs, XFS and friends: no data is copied
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            except OSError:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+    except (OSError, AttributeError):
+        # copy_file_range is missing or refused this pair of filesystems
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+# Breeze-like look for the whole application, applied by MainWindow.setup_style
+APP_STYLESHEET = """
+    QMainWindow { background-color: #fcfcfc; }
+    QWidget { font-family: 'Noto Sans', 'Roboto', sans-serif; font-size: 10pt; color: #232629; }
+    QGroupBox { font-weight: bold; border: 1px solid #c2c7cb; border-radius: 4px; 
+               margin-top: 12px; padding-top: 12px; background-color: #fcfcfc; }
+    QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 8px 0 8px; color: #232629; }
+    QPushButton { background-color: #3daee9; border: none; border-radius: 4px; color: white; 
+                 padding: 6px 16px; font-weight: bold; min-height: 24px; min-width: 80px; }
+    QPushButton:hover { background-color: #1d99e3; }
+    QPushButton:pressed { background-color: #0d8add; }
+    QPushButton:disabled { background-color: #bdc3c7; color: #7f8c8d; }
+    QPushButton#secondary { background-color: transparent; border: 1px solid #c2c7cb; color: #232629; }
+    QPushButton#secondary:hover { background-color: #eff0f1; border-color: #93cee9; }
+    QPushButton#danger { background-color: #da4453; color: white; }
+    QPushButton#danger:hover { background-color: #c03d4a; }
+    QLabel { color: #232629; }
+    QLabel#title { font-size: 18pt; font-weight: bold; color: #232629; }
+    QLabel#subtitle { font-size: 10pt; color: #5e646b; }
+    QProgressBar { border: 1px solid #c2c7cb; border-radius: 2px; background-color: #fcfcfc; 
+                  text-align: center; height: 16px; }
+    QProgressBar::chunk { background-color: #3daee9; border-radius: 2px; }
+    QTextEdit { border: 1px solid #c2c7cb; border-radius: 4px; background-color: white; 
+               font-family: 'Monospace', 'Consolas', 'Courier New'; font-size: 9pt; 
+               padding: 8px; selection-background-color: #3daee9; selection-color: white; }
+    QTreeView, QTableWidget { border: 1px solid #c2c7cb; border-radius: 4px; background-color: white; }
+    QTreeView::item, QTableWidget::item { padding: 4px; }
+    QTreeView::item:selected, QTableWidget::item:selected { background-color: #3daee9; color: white; }
+    QHeaderView::section { background-color: #eff0f1; padding: 6px; border: 1px solid #c2c7cb; }
+    QSplitter::handle { background-color: #c2c7cb; width: 4px; }
+    QSplitter::handle:hover { background-color: #93cee9; }
+    QTabWidget::pane { border: 1px solid #c2c7cb; border-radius: 4px; background-color: #fcfcfc; top: -1px; }
+    QTabBar::tab { background-color: #eff0f1; color: #5e646b; padding: 8px 16px; margin-right: 1px; 
+                  border: 1px solid #c2c7cb; border-bottom: none; border-top-left-radius: 4px; 
+                  border-top-right-radius: 4px; }
+    QTabBar::tab:selected { background-color: #fcfcfc; color: #232629; border-bottom: 1px solid #fcfcfc; 
+                           margin-bottom: -1px; }
+"""
+
+# Help > About text; the version is fixed for the life of the process
+ABOUT_TEXT = f"""
+    <h3>Tarball Installer v{__version__}</h3>
+    <p>A graphical tool for installing software from tarball archives.</p>
+    
+    <p><b>Key Features:</b></p>
+    <ul>
+    <li>Manual binary selection via system file picker</li>
+    <li>Smart package analysis showing all executables</li>
+    <li>System integration (desktop entries, icons)</li>
+    <li>Mandatory marker files for installation tracking</li>
+    <li>Complete uninstallation with file removal</li>
+    <li>Auto-detection of existing installations</li>
+    </ul>
+    
+    <p><b>Note:</b> Most tarballs can be run directly without installation.
+    This tool provides system integration for better user experience.</p>
+    
+    <p>© 2025 Chief Denis</p>
+    """
+
+class WelcomeDialog(QDialog):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setup_ui()
+        
+    def setup_ui(self):
+        self.setWindowTitle("Welcome to Tarball Installer")
+        self.setFixedSize(600, 500)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        
+        header = QLabel("Welcome to Tarball Installer")
+        header_font = QFont()
+        header_font.setPointSize(16)
+        header_font.setBold(True)
+        header.setFont(header_font)
+        header.setAlignment(Qt.AlignCenter)
+        layout.addWidget(header)
+        
+        info_text = QLabel(f"""
+        <div style='line-height: 1.6;'>
+        <h3>Tarball Installer v{__version__}</h3>
+        <p><b>You don't always need to install tarballs!</b></p>
+        
+        <p>Most applications in tarball format can be run directly from their extracted folder. 
+        Simply extract the tarball to a location of your choice (like ~/Applications) and run 
+        the executable from there.</p>
+        
+        <h4>Why use this installer then?</h4>
+        
+        <p>This installer provides several conveniences:</p>
+        
+        <ul>
+        <li><b>Application Menu Integration:</b> Adds entries to your system application menu</li>
+        <li><b>Desktop Launcher:</b> Creates desktop shortcuts for quick access</li>
+        <li><b>System Integration:</b> Properly installs icons and file associations</li>
+        <li><b>Easy Updates:</b> Track and update installed applications</li>
+        <li><b>Clean Removal:</b> Easily uninstall applications when no longer needed</li>
+        </ul>
+        
+        <h4>Recommendation:</h4>
+        
+        <p>• <b>Try running from folder first</b> to test the application<br>
+        • <b>Use this installer</b> when you want full system integration</p>
+        </div>
+        """)
+        info_text.setWordWrap(True)
+        
+        scroll = QScrollArea()
+        scroll.setWidget(info_text)
+        scroll.setWidgetResizable(True)
+        scroll.setMinimumHeight(300)
+        layout.addWidget(scroll)
+        
+        options_group = QGroupBox("Options")
+        options_layout = QVBoxLayout()
+        
+        self.show_welcome = QCheckBox("Show this welcome message on startup")
+        self.show_welcome.setChecked(True)
+        options_layout.addWidget(self.show_welcome)
+        options_group.setLayout(options_layout)
+        layout.addWidget(options_group)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok)
+        button_box.accepted.connect(self.accept)
+        layout.addWidget(button_box)
+
+class InstallationLogDialog(QDialog):
+    def __init__(self, log_text, parent=None):
+        super().__init__(parent)
+        self.setup_ui(log_text)
+        
+    def setup_ui(self, log_text):
+        self.setWindowTitle("Installation Log")
+        self.setMinimumSize(700, 500)
+        
+        layout = QVBoxLayout(self)
+        
+        # Title
+        title = QLabel("Installation Log")
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        title.setAlignment(Qt.AlignCenter)
+        layout.addWidget(title)
+        
+        # Log display
+        self.log_display = QTextEdit()
+        self.log_display.setReadOnly(True)
+        self.log_display.setFont(QFont("Monospace", 9))
+        self.log_display.setPlainText(log_text)
+        
+        # Add line numbers
+        self.add_line_numbers()
+        
+        layout.addWidget(self.log_display)
+        
+        # Buttons
+        button_box = QHBoxLayout()
+        
+        copy_btn = QPushButton("Copy to Clipboard")
+        copy_btn.clicked.connect(self.copy_to_clipboard)
+        
+        save_btn = QPushButton("Save to File...")
+        save_btn.clicked.connect(self.save_to_file)
+        
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        close_btn.setDefault(True)
+        
+        button_box.addWidget(copy_btn)
+        button_box.addWidget(save_btn)
+        button_box.addStretch()
+        button_box.addWidget(close_btn)
+        
+        layout.addLayout(button_box)
+    
+    def add_line_numbers(self):
+        """Simple line number formatting"""
+        lines = self.log_display.toPlainText().split('\n')
+        numbered_lines = []
+        for i, line in enumerate(lines, 1):
+            numbered_lines.append(f"{i:4d} | {line}")
+        self.log_display.setPlainText('\n'.join(numbered_lines))
+    
+    def copy_to_clipboard(self):
+        clipboard = QApplication.clipboard()
+        clipboard.setText(self.log_display.toPlainText())
+        QMessageBox.information(self, "Copied", "Log copied to clipboard!")
+    
+    def save_to_file(self):
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Installation Log",
+            str(Path.home() / "tarball-installer-log.txt"),
+            "Text files (*.txt);;All files (*.*)"
+        )
+        
+        if file_path:
+            try:
+                with open(file_path, 'w') as f:
+                    f.write(self.log_display.toPlainText())
+                QMessageBox.information(self, "Saved", f"Log saved to:\n{file_path}")
+            except Exception as e:
+                QMessageBox.critical(self, "Save Error", f"Could not save file:\n{str(e)}")        
+
+class ExtractThread(QThread):
+    progress = Signal(int)
+    finished = Signal(bool, str, int)
+    
+    def __init__(self, tarball_path, dest_dir):
+        super().__init__()
+        self.tarball_path = tarball_path
+        self.dest_dir = dest_dir
+        self.cancelled = False
+        self.last_progress = -1
+        self.last_report = 0.0
+    
+    def cancel(self):
+        self.cancelled = True
+    
+    def report_progress(self, progress):
+        """Emit a changed percentage, at most once per PROGRESS_INTERVAL until it hits 100"""
+        now = time.monotonic()
+        if progress != self.last_progress and (progress >= 100 or now - self.last_report >= PROGRESS_INTERVAL):
+            self.last_progress = progress
+            self.last_report = now
+            self.progress.emit(progress)
+    
+    def run(self):
+        """Stream the tarball into dest_dir, reporting the member count when done"""
+        import tarfile  # only needed when extracting
+        try:
+            total_size = os.path.getsize(self.tarball_path) or 1
+            count = 0
+            
+            with open(self.tarball_path, 'rb', buffering=TAR_READ_BUFSIZE) as raw, \
+                    tarfile.open(fileobj=raw, mode='r:*', copybufsize=TAR_COPY_BUFSIZE) as tar:
+                # Skip absolute paths, links out of dest_dir and device files
+                # wherever tarfile has extraction filters (3.11.4 and later)
+                if hasattr(tarfile, 'data_filter'):
+                    tar.extraction_filter = tarfile.data_filter
+                # Iterating reads one header at a time instead of listing the archive
+                # first, which extractall would do with an extra pass over the data
+                for member in tar:
+                    if self.cancelled:
+                        self.finished.emit(False, "Extraction cancelled", count)
+                        return
+                    tar.extract(member, self.dest_dir)
+                    count += 1
+                    self.report_progress(int((raw.tell() / total_size) * 100))
+            
+            self.finished.emit(True, "", count)
+        except Exception as e:
+            self.finished.emit(False, str(e), 0)
+
+class PreviewThread(ExtractThread):
+    """Sort the tarball's members from their headers without extracting anything"""
+    
+    def __init__(self, tarball_path, limit=100):
+        super().__init__(tarball_path, None)
+        self.limit = limit
+        self.rows = []
+        self.desktop_files = []
+        self.binaries = []
+        self.icons = []
+    
+    def preview_row(self, member, kind):
+        """The name, type and size text for one contents table row, from the member's header"""
+        name = os.path.basename(member.name.rstrip('/')) or member.name
+        prefix = KIND_PREFIXES.get(kind)
+        display_name = f"{prefix} {name}" if prefix else name
+        
+        if member.isdir():
+            type_text = "📁 Directory"
+        elif member.isreg():
+            type_text = "📄 File"
+        elif member.issym():
+            type_text = "🔗 Symlink"
+        else:
+            type_text = "❓ Other"
+        
+        size_text = ""
+        if member.isreg():
+            size_kb = member.size / 1024
+            size_text = f"{size_kb:.1f} KB" if size_kb < 1024 else f"{size_kb/1024:.1f} MB"
+        
+        return display_name, type_text, size_text
+    
+    def run(self):
+        import tarfile  # only needed when extracting
+        try:
+            total_size = os.path.getsize(self.tarball_path) or 1
+            count = 0
+            
+            # Stream mode reads forward through the data and never seeks or builds an index
+            with open(self.tarball_path, 'rb', buffering=TAR_READ_BUFSIZE) as raw, \
+                    tarfile.open(fileobj=raw, mode='r|*', bufsize=TAR_READ_BUFSIZE) as tar:
+                for member in tar:
+                    if self.cancelled:
+                        self.finished.emit(False, "Analysis cancelled", count)
+                        return
+                    count += 1
+                    is_desktop = is_binary = is_icon = False
+                    
+                    if not member.isdir():
+                        name = os.path.basename(member.name)
+                        lower = name.lower()
+                        is_desktop = name.endswith('.desktop')
+                        # Without the contents, the exec bits are all there is to go on
+                        is_binary = member.isreg() and bool(member.mode & 0o111)
+                        is_icon = lower.endswith(ICON_EXTENSIONS) and ('icon' in lower or 'icons' in os.path.dirname(member.name).lower())
+                    
+                    if is_desktop:
+                        self.desktop_files.append(member.name)
+                    if is_binary:
+                        self.binaries.append(member.name)
+                    if is_icon:
+                        self.icons.append(member.name)
+                    
+                    if len(self.rows) < self.limit:
+                        kind = 'desktop' if is_desktop else 'binary' if is_binary else 'icon' if is_icon else None
+                        self.rows.append(self.preview_row(member, kind))
+                    
+                    self.report_progress(int((raw.tell() / total_size) * 100))
+            
+            self.finished.emit(True, "", count)
+        except Exception as e:
+            self.finished.emit(False, str(e), 0)
+
+class RemoveTreeTask(QRunnable):
+    """Delete a temp directory on the global thread pool"""
+    
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self.setAutoDelete(True)
+    
+    def run(self):
+        import shutil
+        shutil.rmtree(self.path, ignore_errors=True)
+
+class InstallCancelled(Exception):
+    """Raised inside InstallerThread at the next checkpoint after cancel()"""
+
+class InstallerThread(QThread):
+    progress = Signal(str, int)
+    log = Signal(str)
+    installed = Signal(dict)
+    finished = Signal(bool, str, dict)
+    
+    def __init__(self, tarball_path, options, selected_binary=None, extracted_dir=None):
+        super().__init__()
+        self.tarball_path = tarball_path
+        self.options = options
+        self.selected_binary = selected_binary
+        self.extracted_dir = extracted_dir  # NEW: Reuse existing extraction
+        self.temp_dir = None
+        self.staged_in_shm = False
+        self.installation_data = {}
+        self._desktop_cache = {}
+        self._desktop_contents = {}
+        self._last_progress = None
+        self._pending_log = []
+        self._last_log_flush = 0.0
+        self.cancelled = False
+        # Set once files start going into place; from then on nothing may kill the thread
+        self.installing = False
+        self.commit_lock = threading.Lock()
+        # True only when run() actually stopped at a checkpoint after cancel()
+        self.stopped = False
+    
+    def cancel(self):
+        self.cancelled = True
+    
+    def check_cancelled(self):
+        if self.cancelled:
+            raise InstallCancelled("Installation cancelled")
+    
+    def log_message(self, message):
+        """Queue a log line, sending the batch at most every LOG_FLUSH_INTERVAL"""
+        self._pending_log.append(message)
+        if time.monotonic() - self._last_log_flush >= LOG_FLUSH_INTERVAL:
+            self.flush_log()
+    
+    def flush_log(self):
+        if self._pending_log:
+            self.log.emit('\n'.join(self._pending_log))
+            self._pending_log = []
+        self._last_log_flush = time.monotonic()
+    
+    def report_progress(self, message, value):
+        # Repeats cost a cross-thread event each and change nothing
+        if (message, value) == self._last_progress:
+            return
+        self._last_progress = (message, value)
+        # Keep the log lines ahead of the progress line that follows them
+        self.flush_log()
+        self.progress.emit(message, value)
+        
+    def run(self):
+        # Install-only modules load with the first install, not at startup
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+        # One pool for the whole install: the subtree scan, launcher writes and icon copies
+        self.executor = ThreadPoolExecutor(max_workers=max(os.cpu_count() or 1, INSTALL_WORKERS))
+        try:
+            # Identify the package by its contents, so copies of one tarball share an app_id
+            digest = self.content_digest()
+            self.installation_data = {
+                'app_id': f"tarball_installer_{digest[:12]}",
+                'source_file': self.tarball_path,
+                'source_filename': os.path.basename(self.tarball_path),
+                'install_time': datetime.now().isoformat(),
+                'install_type': self.options.get('install_type', 'user'),
+                'files_installed': [],
+                'desktop_entries': [],
+                'binaries': [],
+                'marker_files': [],
+                'installer_version': __version__
+            }
+            
+            self.log_message(f"Starting installation of {os.path.basename(self.tarball_path)}")
+            
+            # If we have an extracted directory, reuse it
+            if self.extracted_dir and os.path.exists(self.extracted_dir):
+                self.temp_dir = self.extracted_dir
+                self.report_progress("Using existing extraction...", 30)
+            else:
+                self.report_progress("Preparing installation...", 10)
+                self.stage_extraction(digest)
+            
+            self.check_cancelled()
+            self.report_progress("Analyzing package contents...", 70)
+            
+            desktop_files, binaries, icons = self.scan_extraction(self.temp_dir)
+            
+            # Use selected binary if provided, otherwise auto-detect
+            main_binary = self.selected_binary or self.identify_main_binary(binaries, desktop_files)
+            self.installation_data['main_binary'] = main_binary
+            
+            self.log_message(f"Found: {len(desktop_files)} desktop files, {len(binaries)} binaries, {len(icons)} icons")
+            if main_binary:
+                self.log_message(f"Using binary: {os.path.basename(main_binary)}")
+            
+            self.installation_data['desktop_files'] = [os.path.basename(f) for f in desktop_files]
+            self.installation_data['binaries'] = [os.path.basename(f) for f in binaries]
+            
+            # Last checkpoint: once files start going into place the install runs to the end
+            with self.commit_lock:
+                self.check_cancelled()
+                self.installing = True
+            if self.options.get('install_type') == 'user':
+                install_data = self.install_to_user(desktop_files, binaries, icons, main_binary)
+            else:
+                install_data = self.install_system_wide(desktop_files, binaries, icons, main_binary)
+            
+            self.installation_data.update(install_data)
+            
+            self.report_progress("Cleaning up...", 95)
+            
+            # Drop what the install left of the staged extraction. A directory
+            # the caller handed us has usually been moved into ~/Applications
+            # by stage_app_dir; the caller cleans up whatever is left of it
+            if self.temp_dir and not self.extracted_dir:
+                if os.path.exists(self.temp_dir):
+                    shutil.rmtree(self.temp_dir)
+            
+            self.report_progress("Installation complete!", 100)
+            self.installed.emit(self.installation_data)
+            self.finished.emit(True, "Application installed successfully!", self.installation_data)
+            
+        except InstallCancelled as e:
+            self.stopped = True
+            # A cancelled install keeps its extraction for the next attempt,
+            # unless it is holding RAM in /dev/shm
+            if self.staged_in_shm:
+                self.discard_staged_extraction()
+            self.log_message(str(e))
+            self.flush_log()
+            self.finished.emit(False, str(e), {})
+        except Exception as e:
+            # Only a cancelled install keeps its extraction for the next attempt
+            self.discard_staged_extraction()
+            self.log_message(f"Error: {str(e)}")
+            self.flush_log()
+            self.finished.emit(False, str(e), {})
+        finally:
+            self.executor.shutdown()
+    
+    def discard_staged_extraction(self):
+        import shutil
+        if self.temp_dir and not self.extracted_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def prune_extraction_cache(self, cache_dir, keep):
+        """Remove staged extractions unused for EXTRACTION_CACHE_MAX_AGE"""
+        import shutil
+        cutoff = time.time() - EXTRACTION_CACHE_MAX_AGE
+        try:
+            with os.scandir(cache_dir) as it:
+                stale = [entry.path for entry in it
+                         if entry.name != keep and entry.stat(follow_symlinks=False).st_mtime < cutoff]
+        except OSError:
+            return
+        for path in stale:
+            # Deletion overlaps the install; run() waits for the pool before returning
+            self.executor.submit(shutil.rmtree, path, True)
+
+    def stage_extraction(self, digest):
+        """Point temp_dir at a complete extraction of the tarball, staged under its digest"""
+        cache_dir = self.extraction_cache_dir()
+        # A tree staged on another filesystem gets copied into ~/Applications
+        # anyway, so extract it in RAM and skip the disk writeback
+        shm_dir = None
+        if not self.same_filesystem(cache_dir, Path.home() / 'Applications'):
+            shm_dir = self.shm_staging_dir()
+        
+        for staging_dir in filter(None, (shm_dir, cache_dir)):
+            self.prune_extraction_cache(staging_dir, digest)
+            staged_dir = staging_dir / digest
+            # Reuse an extraction a cancelled or abandoned install left behind
+            if staged_dir.is_dir() and any(staged_dir.iterdir()):
+                os.utime(staged_dir)  # keeps it from being pruned while in use
+                self.temp_dir = str(staged_dir)
+                self.staged_in_shm = staging_dir == shm_dir
+                self.report_progress("Using cached extraction...", 30)
+                self.log_message(f"Reusing staged extraction: {self.temp_dir}")
+                return
+        
+        if shm_dir:
+            try:
+                self.extract_staged(shm_dir / digest)
+                self.staged_in_shm = True
+                return
+            except OSError as e:
+                # The free-space check only guesses the unpacked size
+                if e.errno != errno.ENOSPC:
+                    raise
+                self.log_message("Not enough room in /dev/shm, extracting to disk instead")
+        self.extract_staged(cache_dir / digest)
+    
+    def extract_staged(self, staged_dir):
+        import shutil
+        import tempfile
+        shutil.rmtree(staged_dir, ignore_errors=True)
+        self.temp_dir = tempfile.mkdtemp(prefix=f"{staged_dir.name}.", dir=staged_dir.parent)
+        
+        self.log_message(f"Extracting to temporary directory: {self.temp_dir}")
+        try:
+            self.extract_tarball()
+        except BaseException:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
+            raise
+        # Only a complete extraction gets the name that marks it reusable
+        os.rename(self.temp_dir, staged_dir)
+        self.temp_dir = str(staged_dir)
+    
+    def extraction_cache_dir(self):
+        """Create and return the on-disk directory extractions are staged in"""
+        cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+        cache_dir = Path(cache_home) / 'tarball-installer' / 'extracted'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return cache_dir
+    
+    def same_filesystem(self, path, other):
+        def device(path):
+            # Paths that don't exist yet will be created in their nearest parent
+            path = Path(path).absolute()
+            while not path.exists():
+                path = path.parent
+            return path.stat().st_dev
+        return device(path) == device(other)
+    
+    def shm_staging_dir(self):
+        """A private directory in /dev/shm, or None if tmpfs can't take the extraction"""
+        try:
+            st = os.statvfs('/dev/shm')
+            # Leave room for the archive expanding several times over
+            if st.f_bavail * st.f_frsize < 4 * os.path.getsize(self.tarball_path):
+                return None
+            shm_dir = Path('/dev/shm') / f'tarball-installer-{os.getuid()}'
+            shm_dir.mkdir(mode=0o700, exist_ok=True)
+            # /dev/shm is shared, so refuse a directory someone else planted
+            st = os.lstat(shm_dir)
+        except OSError:
+            return None
+        if stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid():
+            return shm_dir
+        return None
+    
+    def content_digest(self):
+        """SHA-256 of the tarball contents, read in chunks so a cancel isn't held up"""
+        import hashlib
+        total_size = os.path.getsize(self.tarball_path) or 1
+        digest = hashlib.sha256()
+        with open(self.tarball_path, 'rb') as f:
+            while chunk := f.read(TAR_READ_BUFSIZE):
+                self.check_cancelled()
+                digest.update(chunk)
+                # Hashing covers the first 10%, up to "Preparing installation"
+                self.report_progress("Reading package...", int((f.tell() / total_size) * 10))
+        return digest.hexdigest()
+    
+    def extract_tarball(self):
+        """Extract with the system tar when available, falling back to tarfile"""
+        import shutil
+        import subprocess
+        tar_binary = shutil.which('tar')
+        if tar_binary:
+            try:
+                self.extract_with_system_tar(tar_binary)
+                return
+            except (OSError, subprocess.CalledProcessError) as e:
+                self.log_message(f"System tar failed, using built-in extraction: {getattr(e, 'stderr', None) or e}")
+        
+        self.extract_with_tarfile()
+    
+    def extract_with_system_tar(self, tar_binary):
+        """Pipe the tarball into tar, tracking progress by bytes fed"""
+        import subprocess
+        import tempfile
+        with open(self.tarball_path, 'rb') as f:
+            magic = f.read(6)
+        
+        args = [tar_binary, '-x', '-f', '-', '-C', self.temp_dir]
+        for prefix, flag in TAR_COMPRESSION_FLAGS.items():
+            if magic.startswith(prefix):
+                args.insert(2, self.decompress_option(flag))
+                break
+        
+        total_size = os.path.getsize(self.tarball_path) or 1
+        last_progress = 10
+        
+        # stderr goes to a file: a chatty tar could otherwise fill the pipe and deadlock
+        with open(self.tarball_path, 'rb') as f, tempfile.TemporaryFile() as errors:
+            proc = subprocess.Popen(args, stdin=subprocess.PIPE, stderr=errors)
+            try:
+                while chunk := f.read(TAR_READ_BUFSIZE):
+                    if self.cancelled:
+                        proc.kill()
+                        proc.wait()
+                        raise InstallCancelled("Installation cancelled")
+                    proc.stdin.write(chunk)
+                    progress = 10 + int((f.tell() / total_size) * 60)
+                    if progress != last_progress:
+                        last_progress = progress
+                        self.report_progress("Extracting files...", progress)
+            except BrokenPipeError:
+                pass  # tar exited early; its status is checked below
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+            
+            if proc.wait() != 0:
+                errors.seek(0)
+                raise subprocess.CalledProcessError(
+                    proc.returncode, args, stderr=errors.read().decode(errors='replace').strip())
+    
+    def decompress_option(self, flag):
+        """Swap tar's compression flag for a parallel decompressor if one is installed"""
+        import shutil
+        for program in TAR_PARALLEL_DECOMPRESSORS.get(flag, ()):
+            program_path = shutil.which(program)
+            if program_path:
+                self.log_message(f"Decompressing with {program}")
+                return f'--use-compress-program={program_path}'
+        return flag
+    
+    def extract_with_tarfile(self):
+        """Extract members as they are read instead of listing the archive first"""
+        import tarfile  # only needed when extracting
+        total_size = os.path.getsize(self.tarball_path) or 1
+        last_progress = 10
+        
+        # Refuse absolute paths, '..' and links out of the tree, as ExtractThread
+        # does; applied by hand so the chmod below gets the checked member
+        data_filter = getattr(tarfile, 'data_filter', None)
+        extract_options = {'filter': 'fully_trusted'} if data_filter else {}
+        
+        with open(self.tarball_path, 'rb', buffering=TAR_READ_BUFSIZE) as raw, \
+                tarfile.open(fileobj=raw, mode='r:*', copybufsize=TAR_COPY_BUFSIZE) as tar:
+            # Iterating calls tar.next(), so each member is extracted straight off the stream
+            for member in tar:
+                self.check_cancelled()
+                if data_filter:
+                    member = data_filter(member, self.temp_dir)
+                # Skip the per-member chown/chmod/utime, but keep the exec bits
+                # that binary detection and the launchers rely on
+                tar.extract(member, self.temp_dir, set_attrs=False, **extract_options)
+                if member.isreg() and member.mode & 0o111:
+                    os.chmod(os.path.join(self.temp_dir, member.name), member.mode & 0o777)
+                # Measure progress on the compressed input, so no member count is needed
+                progress = 10 + int((raw.tell() / total_size) * 60)
+                if progress != last_progress:
+                    last_progress = progress
+                    self.report_progress("Extracting files...", progress)
+    
+    def scan_extraction(self, temp_dir):
+        """Find desktop files, binaries and icons in one pass, one worker per subtree"""
+        found = ([], [], [])
+        subtrees = []
+        # Files at the top are classified here, subdirectories go to the pool
+        # in listing order so the results come out the same as a single walk
+        with os.scandir(self.find_extraction_root(temp_dir)) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subtrees.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    self.classify_file(entry, found)
+        for desktop_files, binaries, icons in self.executor.map(self.scan_subtree, subtrees):
+            found[0].extend(desktop_files)
+            found[1].extend(binaries)
+            found[2].extend(icons)
+        return found
+    
+    def scan_subtree(self, top):
+        found = ([], [], [])
+        for entry in walk_files(top):
+            self.classify_file(entry, found)
+        return found
+    
+    def classify_file(self, entry, found):
+        desktop_files, binaries, icons = found
+        name = entry.name
+        lower_name = name.lower()
+        # Each file lands in one bucket; only files that are neither desktop
+        # entries nor images pay for the stat and header read
+        if name.endswith('.desktop'):
+            desktop_files.append(entry.path)
+        elif lower_name.endswith(ICON_EXTENSIONS):
+            if 'icon' in lower_name or 'icons' in os.path.dirname(entry.path).lower():
+                icons.append(entry.path)
+        elif self.is_binary(entry):
+            binaries.append(entry.path)
+    
+    def is_binary(self, entry):
+        """Check for executables, including ones without extensions"""
+        try:
+            st = entry.stat()
+            if not st.st_mode & 0o111:
+                return False
+            with open(entry.path, 'rb') as f:
+                head = f.read(4096)
+        except OSError:
+            return False
+        # ELF binary or script with shebang
+        if head[:4] == b'\x7fELF' or head[:2] == b'#!':
+            return True
+        # Also include files without extensions that are executable
+        # (common for many Linux applications)
+        if '.' not in entry.name and st.st_size > 100:
+            # If a good share of the header is non-ASCII, likely a binary
+            non_ascii = len(head.translate(None, ASCII_BYTES))
+            return non_ascii > len(head) // 8
+        return False
+    
+    def find_extraction_root(self, temp_dir):
+        """Find the actual root directory where tarball contents were extracted"""
+        # List contents of temp_dir
+        items = os.listdir(temp_dir)
+        
+        # If there's only one item and it's a directory, that's likely the root
+        if len(items) == 1 and os.path.isdir(os.path.join(temp_dir, items[0])):
+            return os.path.join(temp_dir, items[0])
+        
+        # Otherwise, return the temp_dir itself
+        return temp_dir
+    
+    def identify_main_binary(self, binaries, desktop_files):
+        if not binaries:
+            return None
+        
+        # Check desktop file first
+        if desktop_files:
+            desktop_info = self.parse_desktop_file(desktop_files[0])
+            exec_cmd = desktop_info.get('exec', '')
+            if exec_cmd:
+                exec_binary = exec_cmd.split()[0] if ' ' in exec_cmd else exec_cmd
+                exec_binary = os.path.basename(exec_binary)
+                for binary in binaries:
+                    if os.path.basename(binary) == exec_binary:
+                        return binary
+        
+        # Simple scoring
+        scored_binaries = []
+        for binary in binaries:
+            score = 0
+            bin_name = os.path.basename(binary)
+            bin_path = binary.lower()
+            lower_name = bin_name.lower()
+            
+            # Prefer files in bin directories
+            if 'bin' in bin_path:
+                score += 10
+            
+            # Prefer files without extensions (most Linux executables)
+            if '.' not in bin_name:
+                score += 8
+            elif bin_name.endswith(('.sh', '.py', '.pl')):
+                score += 3
+            
+            # Common main executable names
+            for name in MAIN_BINARY_NAMES:
+                if name in lower_name:
+                    score += 5
+                    break
+            
+            # Avoid clear uninstallers if we have alternatives
+            if 'uninstall' in lower_name or 'remove' in lower_name:
+                score -= 3
+            
+            scored_binaries.append((binary, score, bin_name))
+        
+        scored_binaries.sort(key=lambda x: x[1], reverse=True)
+        
+        # Log scoring results for debugging
+        self.log_message("Binary scoring results:")
+        for binary, score, name in scored_binaries[:3]:  # Top 3
+            self.log_message(f"  {name}: {score} points")
+        
+        return scored_binaries[0][0] if scored_binaries else binaries[0]
+    
+    def parse_desktop_file(self, desktop_path):
+        # identify_main_binary and install_to_user both ask for the same file
+        if desktop_path not in self._desktop_cache:
+            self._desktop_cache[desktop_path] = self.read_desktop_file(desktop_path)
+        return self._desktop_cache[desktop_path]
+    
+    def desktop_text(self, desktop_path):
+        """Contents of a desktop file, read at most once per install"""
+        if desktop_path not in self._desktop_contents:
+            with open(desktop_path, 'r', encoding='utf-8') as f:
+                self._desktop_contents[desktop_path] = f.read()
+        return self._desktop_contents[desktop_path]
+    
+    def read_desktop_file(self, desktop_path):
+        try:
+            content = self.desktop_text(desktop_path)
+            
+            # Key=value pairs in the [Desktop Entry] section, up to the next group
+            start = content.find('[Desktop Entry]')
+            if start != -1 and (start == 0 or content[start - 1] == '\n'):
+                end = content.find('\n[', start)
+                result = dict(DESKTOP_ENTRY_RE.findall(content, start, len(content) if end == -1 else end))
+            else:
+                result = {}
+            
+            return {
+                'name': result.get('Name', 'Unknown'),
+                'comment': result.get('Comment', ''),
+                'exec': result.get('Exec', ''),
+                'icon': result.get('Icon', ''),
+                'categories': result.get('Categories', '').split(';'),
+                'version': result.get('Version', '1.0')
+            }
+        except:
+            pass
+        return {}    
+    
+    def create_marker_file(self, directory, app_info):
+        marker_data = {
+            'installed_by': 'Tarball Installer',
+            'installer_version': __version__,
+            'app_id': self.installation_data['app_id'],
+            'app_name': app_info.get('name', os.path.basename(self.tarball_path)),
+            'app_version': app_info.get('version', '1.0'),
+            'install_time': datetime.now().isoformat(),
+            'install_type': self.options.get('install_type', 'user'),
+            'tarball_source': os.path.basename(self.tarball_path)
+        }
+        
+        marker_path = directory / '.tarball-installer-marker.json'
+        marker_path.write_bytes(dump_json(marker_data))
+        
+        return str(marker_path)
+
+    def stage_app_dir(self, source, destination):
+        """Move the extracted tree into place, copying only across filesystems.
+        
+        Returns True if the tree was moved, False if it was copied.
+        """
+        try:
+            os.rename(source, destination)
+            self.log_message(f"Moved application into {destination}")
+            return True
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+        
+        import shutil
+        shutil.copytree(source, destination, symlinks=True, copy_function=fast_copy)
+        self.log_message(f"Copied application into {destination}")
+        return False
+    
+    def rebase_path(self, path, old_root, new_root):
+        return os.path.join(new_root, os.path.relpath(path, old_root))
+    
+    def launcher_exec(self, match, local_bin):
+        exec_parts = match.group(1).split()
+        if not exec_parts:
+            return match.group(0)
+        binary_name = os.path.basename(exec_parts[0])
+        # Keep arguments (%f, %u, etc.)
+        args = ' ' + ' '.join(exec_parts[1:]) if len(exec_parts) > 1 else ''
+        return f'Exec={local_bin}/{binary_name}{args}'
+    
+    def write_launcher(self, launcher):
+        launcher_path, script = launcher
+        with open(launcher_path, 'w') as f:
+            f.write(script)
+        launcher_path.chmod(0o755)
+        return launcher_path
+    
+    def install_to_user(self, desktop_files, binaries, icons, main_binary):
+        import shutil
+        import subprocess
+        home = Path.home()
+        local_bin = home / '.local' / 'bin'
+        local_apps = home / '.local' / 'share' / 'applications'
+        local_icons = home / '.local' / 'share' / 'icons'
+        
+        local_bin.mkdir(parents=True, exist_ok=True)
+        local_apps.mkdir(parents=True, exist_ok=True)
+        local_icons.mkdir(parents=True, exist_ok=True)
+        
+        install_data = {
+            'install_path': str(local_bin),
+            'desktop_path': str(local_apps),
+            'installed_files': [],
+            'marker_files': []
+        }
+        
+        # Get app info from existing desktop file
+        app_info = {}
+        if desktop_files:
+            app_info = self.parse_desktop_file(desktop_files[0])
+            if app_info.get('name'):
+                self.installation_data['app_name'] = app_info['name']
+                self.installation_data['app_version'] = app_info.get('version', '1.0')
+        else:
+            # Create app name from filename
+            app_name = os.path.basename(self.tarball_path)
+            app_name = TARBALL_SUFFIX_RE.sub('', app_name)
+            app_name = NAME_SEPARATOR_RE.sub(' ', app_name).title()
+            self.installation_data['app_name'] = app_name
+            self.installation_data['app_version'] = '1.0'
+            app_info = {'name': app_name, 'version': '1.0'}
+        
+        # ==== FIXED PART: Install ENTIRE app to ~/Applications/ ====
+        applications_dir = home / 'Applications'
+        applications_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Find where the app was actually extracted in temp_dir
+        extracted_root = self.find_extraction_root(self.temp_dir)
+        app_base_name = os.path.basename(extracted_root)
+        permanent_install_dir = applications_dir / app_base_name
+        
+        # Move ENTIRE app directory to ~/Applications/
+        if permanent_install_dir.exists():
+            shutil.rmtree(permanent_install_dir)
+        if self.stage_app_dir(extracted_root, permanent_install_dir):
+            # The extracted files now live in the install dir
+            desktop_files = [self.rebase_path(f, extracted_root, permanent_install_dir) for f in desktop_files]
+            icons = [self.rebase_path(f, extracted_root, permanent_install_dir) for f in icons]
+            self._desktop_contents = {self.rebase_path(f, extracted_root, permanent_install_dir): text
+                                      for f, text in self._desktop_contents.items()}
+        
+        # Update install_data to track this
+        install_data['app_install_dir'] = str(permanent_install_dir)
+        
+        # Create marker file in the app directory
+        marker_path = self.create_marker_file(permanent_install_dir, app_info)
+        install_data['marker_files'].append(marker_path)
+        self.log_message(f"Created marker file: {marker_path}")
+        
+        # ==== Create launchers in ~/.local/bin/ ====
+        launchers = []
+        for binary in binaries:
+            binary_name = os.path.basename(binary)
+            launcher_path = local_bin / binary_name
+            
+            # Find binary relative to extracted_root
+            binary_rel_path = os.path.relpath(binary, extracted_root)
+            
+            # Create launcher script that cd's to app directory
+            launchers.append((launcher_path, f'''#!/bin/bash
+cd "{permanent_install_dir}"
+exec "./{binary_rel_path}" "$@"
+'''))
+        
+        # The small writes are independent, so let them overlap
+        for launcher_path in self.executor.map(self.write_launcher, launchers):
+            install_data['installed_files'].append(str(launcher_path))
+            self.log_message(f"Created launcher: {launcher_path}")
+        
+        # ==== Install desktop files (update Exec paths) ====
+        for desktop in desktop_files:
+            dest = local_apps / os.path.basename(desktop)
+            
+            try:
+                # Update Exec lines to use our launchers, in one pass over the text
+                content = EXEC_LINE_RE.sub(lambda m: self.launcher_exec(m, local_bin), self.desktop_text(desktop))
+                Path(dest).write_text(content, encoding='utf-8')
+                
+                install_data['installed_files'].append(str(dest))
+                self.log_message(f"Installed desktop entry: {dest}")
+                
+            except Exception as e:
+                self.log_message(f"Warning: Could not update desktop file: {e}")
+                fast_copy(desktop, dest)
+                install_data['installed_files'].append(str(dest))
+        
+        # ==== Install icons ====
+        icon_copies = []
+        for icon in icons:
+            icon_name = os.path.basename(icon)
+            icon_ext = os.path.splitext(icon_name)[1].lower()
+            
+            # Default to scalable
+            size_dir = 'scalable'
+            if icon_ext == '.png':
+                # Try to detect size
+                for size in ['16x16', '32x32', '48x48', '64x64', '128x128', '256x256', '512x512']:
+                    if size in icon or size.replace('x', '') in icon_name:
+                        size_dir = size
+                        break
+            
+            dest_dir = local_icons / 'hicolor' / size_dir / 'apps'
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            dest = dest_dir / icon_name
+            icon_copies.append((icon, dest))
+        
+        for dest in self.executor.map(lambda copy: fast_copy(*copy), icon_copies):
+            install_data['installed_files'].append(str(dest))
+        
+        # Update desktop database
+        try:
+            subprocess.run(['update-desktop-database', str(local_apps)], check=True)
+            self.log_message("Updated desktop database")
+        except subprocess.CalledProcessError as e:
+            self.log_message(f"Warning: Failed to update desktop database: {e}")
+        
+        return install_data    
+    
+    def install_system_wide(self, desktop_files, binaries, icons, main_binary):
+        # For now, just call install_to_user since system-wide requires root
+        # In a real implementation, this would install to /usr/local/bin, /usr/share/applications, etc.
+        self.log_message("System-wide installation not yet implemented. Falling back to user installation.")
+        return self.install_to_user(desktop_files, binaries, icons, main_binary)               
+
+class UninstallThread(QThread):
+    progress = Signal(str, int)
+    log = Signal(str)
+    finished = Signal(bool, str)
+    
+    def __init__(self, installation_data):
+        super().__init__()
+        self.installation_data = installation_data
+        
+    def run(self):
+        import subprocess
+        try:
+            app_name = self.installation_data.get('app_name', 'Unknown')
+            self.log.emit(f"Starting uninstallation of {app_name}")
+            self.progress.emit("Preparing uninstallation...", 10)
+            
+            installed_files = self.installation_data.get('installed_files', [])
+            marker_files = self.installation_data.get('marker_files', [])
+            
+            removed_count = 0
+            total_files = len(installed_files) + len(marker_files)
+            
+            # Remove installed files
+            for i, file_path in enumerate(installed_files):
+                if os.path.exists(file_path):
+                    try:
+                        os.remove(file_path)
+                        removed_count += 1
+                    except Exception as e:
+                        self.log.emit(f"Warning: Could not remove {file_path}: {e}")
+                
+                progress = 10 + int((i / total_files) * 70)
+                self.progress.emit("Removing files...", progress)
+            
+            # Remove marker files
+            for i, marker_path in enumerate(marker_files):
+                if os.path.exists(marker_path):
+                    try:
+                        os.remove(marker_path)
+                        removed_count += 1
+                    except:
+                        pass
+                
+                progress = 80 + int((i / len(marker_files)) * 10)
+                self.progress.emit("Cleaning up...", progress)
+            
+            # Update desktop database
+            if any('.desktop' in f for f in installed_files):
+                try:
+                    home = Path.home()
+                    local_apps = home / '.local' / 'share' / 'applications'
+                    subprocess.run(['update-desktop-database', str(local_apps)], check=True)
+                    self.log.emit("Updated desktop database")
+                except:
+                    self.log.emit("Warning: Could not update desktop database")
+            
+            self.progress.emit("Uninstallation complete!", 100)
+            self.finished.emit(True, f"Successfully removed {removed_count} files")
+            
+        except Exception as e:
+            self.log.emit(f"Error during uninstallation: {str(e)}")
+            self.finished.emit(False, str(e))
+
+class InstallationTracker:
+    # Where installs put markers, relative to the home directory
+    _SCAN_PATHS = (
+        ('.local', 'bin'),
+        ('.local', 'share', 'applications'),
+        ('.local', 'share', 'icons'),
+        ('Applications',),
+        ('bin',),
+    )
+    _SCAN_DEPTH = 6
+    # Never hold a marker, but can be deep enough to dominate the scan
+    _SCAN_PRUNE = frozenset({'.cache', '.git', 'node_modules', '__pycache__'})
+    
+    def __init__(self):
+        self.db_path = Path.home() / '.local' / 'share' / 'tarball-installer' / 'installations.json'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Installs are recorded from the installer thread, everything else from the GUI
+        self.lock = threading.RLock()
+        # Saves are handed to a writer thread so callers never wait on the disk
+        self.save_queue = queue.Queue()
+        self.writer = None
+        # Why the last write failed, or None once a write succeeds
+        self.save_error = None
+        self.installations = self.load_installations()
+        self.index_installations()
+        self.scan_existing_installations()
+    
+    def load_installations(self):
+        if self.db_path.exists():
+            try:
+                return load_json(self.db_path)
+            except:
+                return []
+        return []
+    
+    def index_installations(self):
+        # app_id -> entry, first one wins like the old linear lookups
+        self._by_id = {}
+        for inst in self.installations:
+            self._by_id.setdefault(inst.get('app_id'), inst)
+    
+    def save_installations(self):
+        with self.lock:
+            if self.writer is None:
+                self.writer = threading.Thread(target=self.write_installations,
+                                               name='tracker-writer', daemon=True)
+                self.writer.start()
+        self.save_queue.put(None)
+    
+    def write_installations(self):
+        while True:
+            requests = [self.save_queue.get()]
+            # Saves queued while the last write ran are all covered by this one
+            while True:
+                try:
+                    requests.append(self.save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            # Write next to the database and swap it in, so a crash can't truncate it
+            tmp_path = self.db_path.with_suffix('.tmp')
+            try:
+                with self.lock:
+                    data = dump_json(self.installations)
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, self.db_path)
+                self.save_error = None
+            except Exception as e:
+                self.save_error = e
+                try:
+                    tmp_path.unlink()
+                except OSError:
+                    pass
+            finally:
+                for _ in requests:
+                    self.save_queue.task_done()
+    
+    def flush(self):
+        """Wait for every queued save, returning the error if the last one failed"""
+        self.save_queue.join()
+        return self.save_error
+    
+    def add_installation(self, data):
+        with self.lock:
+            inst = self._by_id.get(data.get('app_id'))
+            if inst is not None:
+                # A marker scan may have found this install before it was recorded
+                inst.pop('discovered', None)
+                inst.update(data)
+                self.save_installations()
+                return
+            
+            self.installations.append(data)
+            self._by_id[data.get('app_id')] = data
+            self.save_installations()
+    
+    def remove_installation(self, app_id):
+        with self.lock:
+            self._by_id.pop(app_id, None)
+            self.installations = [inst for inst in self.installations if inst.get('app_id') != app_id]
+            self.save_installations()
+    
+    def get_installations(self):
+        # A copy, so callers can iterate while the installer thread records an install
+        with self.lock:
+            return list(self.installations)
+    
+    def get_installation_by_id(self, app_id):
+        return self._by_id.get(app_id)
+    
+    def find_marker_files(self):
+        home = Path.home()
+        stack = [(home.joinpath(*parts), self._SCAN_DEPTH) for parts in reversed(self._SCAN_PATHS)]
+        while stack:
+            path, depth = stack.pop()
+            try:
+                with os.scandir(path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            subdirs = []
+            marker = None
+            for entry in entries:
+                try:
+                    if entry.name == '.tarball-installer-marker.json' and entry.is_file(follow_symlinks=False):
+                        marker = entry.path
+                    elif depth > 0 and entry.name not in self._SCAN_PRUNE and entry.is_dir(follow_symlinks=False):
+                        subdirs.append((entry.path, depth - 1))
+                except OSError:
+                    continue
+            if marker is not None:
+                # The marker sits at the top of an installed app; nothing below is another install
+                yield Path(marker)
+                continue
+            stack.extend(reversed(subdirs))
+    
+    def scan_existing_installations(self):
+        found = []
+        for marker_file in self.find_marker_files():
+            try:
+                marker_data = load_json(marker_file)
+                
+                app_id = marker_data.get('app_id')
+                
+                if app_id not in self._by_id:
+                    installation_data = {
+                        'app_id': app_id,
+                        'app_name': marker_data.get('app_name', 'Unknown'),
+                        'app_version': marker_data.get('app_version', '1.0'),
+                        'install_time': marker_data.get('install_time', ''),
+                        'install_type': marker_data.get('install_type', 'user'),
+                        'source_filename': marker_data.get('tarball_source', ''),
+                        'discovered': True,
+                        'marker_file': str(marker_file),
+                        'installed_files': [],
+                        'installer_version': marker_data.get('installer_version', __version__)
+                    }
+                    found.append(installation_data)
+            except:
+                pass
+        
+        # The markers are read without the lock; an install recorded meanwhile wins
+        discovered = 0
+        with self.lock:
+            for installation_data in found:
+                if installation_data['app_id'] not in self._by_id:
+                    self.installations.append(installation_data)
+                    self._by_id[installation_data['app_id']] = installation_data
+                    discovered += 1
+            
+            # One write for the whole scan, and none when nothing new turned up
+            if discovered:
+                self.save_installations()
+    
+    def cleanup_orphaned_markers(self):
+        orphaned_markers = []
+        
+        for marker_file in self.find_marker_files():
+            try:
+                marker_data = load_json(marker_file)
+                
+                app_id = marker_data.get('app_id')
+                if app_id not in self._by_id:
+                    orphaned_markers.append(marker_file)
+            except:
+                continue
+        
+        removed_count = 0
+        for marker_file in orphaned_markers:
+            try:
+                marker_file.unlink()
+                removed_count += 1
+            except:
+                pass
+        
+        return len(orphaned_markers), removed_count
+
+class InstallationsModel(QAbstractTableModel):
+    """Tracked installations as preformatted rows for the Manage tab's view"""
+    HEADERS = ["Application", "Version", "Install Date", "Type", "Status"]
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+    
+    def set_installations(self, installations):
+        self.beginResetModel()
+        self.rows = [self.installation_row(install) for install in installations]
+        self.endResetModel()
+    
+    def installation_row(self, install):
+        """(column texts, app_id) for one tracker entry"""
+        app_name = install.get('app_name', os.path.basename(install.get('source_file', 'Unknown')))
+        install_time = install.get('install_time', '')
+        if install_time:
+            install_time = format_install_date(install_time)
+        
+        status = '✓ Installed'
+        if install.get('discovered'):
+            status = '🔍 Discovered'
+        
+        texts = (
+            app_name,
+            install.get('app_version', 'Unknown'),
+            install_time,
+            'User' if install.get('install_type') == 'user' else 'System',
+            status
+        )
+        return texts, install.get('app_id')
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        texts, app_id = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return texts[index.column()]
+        if role == Qt.UserRole:
+            return app_id
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+class MainWindow(QMainWindow):
+    _style_applied = False
+    
+    def __init__(self):
+        super().__init__()
+        self._tracker = None
+        # The installer thread may be the first to need the tracker
+        self.tracker_lock = threading.Lock()
+        self.current_file = None
+        self.downloads_dir = str(Path.home() / "Downloads")
+        self.extract_thread = None
+        self.installer_thread = None
+        self.install_running = False
+        self.uninstall_thread = None
+        self.uninstall_dialog = None
+        self.uninstall_label = None
+        self.uninstall_progress = None
+        self.uninstall_log_display = None
+        self.analyzed_file = None
+        self.extracted_file = None
+        self.extracted_root = None
+        self.temp_analysis_dir = None
+        self.detected_binaries = []
+        self.user_selected_binary = None
+        
+        # Load settings
+        self.settings_path = Path.home() / '.config' / 'tarball-installer' / 'settings.json'
+        self.load_settings()
+        
+        #Store installation log
+        self.installation_log = ""
+        # Log lines waiting for the next batched append, per text widget
+        self.pending_log_lines = {}
+        self.log_flush_pending = False
+        self.last_progress = None
+        self.last_uninstall_progress = None
+        
+        # Style first, so the widgets are polished once as they are created
+        self.setup_style()
+        self.setup_ui()
+        # Wait until the window is on screen so the dialog has a visible parent
+        QTimer.singleShot(0, self.show_welcome_dialog)
+    
+    @property
+    def tracker(self):
+        """The installation tracker, loaded and scanned on first use"""
+        with self.tracker_lock:
+            if self._tracker is None:
+                self._tracker = InstallationTracker()
+            return self._tracker
+    
+    def record_installation(self, install_data):
+        # Runs on the installer thread, so a tracker built here scans off the GUI thread
+        self.tracker.add_installation(install_data)
+    
+    def load_settings(self):
+        """Load user settings"""
+        self.settings = {'show_log_after_install': True}  # Default to showing log
+        
+        if self.settings_path.exists():
+            try:
+                with open(self.settings_path, 'r') as f:
+                    saved_settings = json.load(f)
+                    self.settings.update(saved_settings)
+            except:
+                pass
+    
+    def save_settings(self):
+        """Save user settings"""
+        self.settings_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.settings_path, 'w') as f:
+            json.dump(self.settings, f, indent=2)
+    
+    def on_log_preference_changed(self):
+        """Save user preference for showing log"""
+        self.settings['show_log_after_install'] = self.show_log_checkbox.isChecked()
+        self.save_settings()
+        
+    def show_welcome_dialog(self):
+        settings_path = Path.home() / '.config' / 'tarball-installer' / 'settings.json'
+        show_welcome = True
+        
+        if settings_path.exists():
+            try:
+                with open(settings_path, 'r') as f:
+                    settings = json.load(f)
+                    show_welcome = settings.get('show_welcome', True)
+            except:
+                pass
+        
+        if show_welcome:
+            dialog = WelcomeDialog(self)
+            if dialog.exec():
+                settings_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(settings_path, 'w') as f:
+                    json.dump({'show_welcome': dialog.show_welcome.isChecked()}, f)
+        
+    def setup_style(self):
+        # One application-wide sheet, parsed once however many windows exist
+        if not MainWindow._style_applied:
+            QApplication.instance().setStyleSheet(APP_STYLESHEET)
+            MainWindow._style_applied = True
+        
+        self.setWindowIcon(QIcon.fromTheme("application-x-tar"))
+        
+    def setup_ui(self):
+        self.setWindowTitle(f"Tarball Installer v{__version__}")
+        self.setGeometry(100, 100, 900, 650)
+        
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setContentsMargins(12, 12, 12, 12)
+        main_layout.setSpacing(8)
+        
+        self.setup_menu_bar()
+        
+        # Removed header widgets to save space        
+        
+        self.tab_widget = QTabWidget()
+        self.setup_install_tab()
+        self.setup_manage_tab()
+        self.setup_help_tab()
+        # Manage and Help fill themselves in when first selected
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        
+        main_layout.addWidget(self.tab_widget, 1)
+        
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        # Worker progress goes to a label, which repaints with the next
+        # event loop pass instead of straight away like showMessage
+        self.progress_label = QLabel()
+        self.status_bar.addPermanentWidget(self.progress_label)
+        self.status_bar.showMessage("Ready")
+        
+    def setup_menu_bar(self):
+        menubar = self.menuBar()
+        
+        file_menu = menubar.addMenu("&File")
+        open_action = QAction("&Open Tarball...", self)
+        open_action.setShortcut("Ctrl+O")
+        open_action.triggered.connect(self.browse_file)
+        file_menu.addAction(open_action)
+        
+        scan_action = QAction("&Scan for Existing Installations", self)
+        scan_action.triggered.connect(self.scan_installations)
+        file_menu.addAction(scan_action)
+        
+        file_menu.addSeparator()
+        exit_action = QAction("E&xit", self)
+        exit_action.setShortcut("Ctrl+Q")
+        exit_action.triggered.connect(self.close)
+        file_menu.addAction(exit_action)
+        
+        view_menu = menubar.addMenu("&View")
+        welcome_action = QAction("Show &Welcome Message", self)
+        welcome_action.triggered.connect(self.show_welcome_dialog)
+        view_menu.addAction(welcome_action)
+        
+        tools_menu = menubar.addMenu("&Tools")
+        refresh_action = QAction("&Refresh Application List", self)
+        refresh_action.triggered.connect(self.refresh_apps_list)
+        tools_menu.addAction(refresh_action)
+        
+        cleanup_action = QAction("&Cleanup Orphaned Markers", self)
+        cleanup_action.triggered.connect(self.cleanup_markers)
+        tools_menu.addAction(cleanup_action)
+        
+        # NEW: View last installation log
+        view_log_action = QAction("View &Last Installation Log", self)
+        view_log_action.triggered.connect(self.view_last_log)
+        tools_menu.addAction(view_log_action)
+        
+        help_menu = menubar.addMenu("&Help")
+        about_action = QAction("&About", self)
+        about_action.triggered.connect(self.show_about_dialog)
+        help_menu.addAction(about_action)
+        
+    def setup_install_tab(self):
+        install_tab = QWidget()
+        main_layout = QHBoxLayout(install_tab)
+        main_layout.setSpacing(12)
+        
+        # Left panel
+        left_panel = QWidget()
+        left_layout = QVBoxLayout(left_panel)
+        left_layout.setSpacing(12)
+        
+        file_group = QGroupBox("Package Selection")
+        file_layout = QVBoxLayout()
+        
+        self.file_label = QLabel("No package selected")
+        self.file_label.setWordWrap(True)
+        self.file_label.setStyleSheet("padding: 8px; background-color: #eff0f1; border-radius: 4px; min-height: 40px;")
+        
+        file_button_layout = QHBoxLayout()
+        browse_btn = QPushButton("Browse for Tarball...")
+        browse_btn.clicked.connect(self.browse_file)
+        
+        self.analyze_btn = QPushButton("Analyze Package")
+        self.analyze_btn.clicked.connect(self.analyze_package)
+        self.analyze_btn.setEnabled(False)
+        self.analyze_btn.setObjectName("secondary")
+        
+        file_button_layout.addWidget(browse_btn)
+        file_button_layout.addWidget(self.analyze_btn)
+        file_button_layout.addStretch()
+        
+        file_layout.addWidget(self.file_label)
+        file_layout.addLayout(file_button_layout)
+        file_group.setLayout(file_layout)
+        left_layout.addWidget(file_group)
+        
+        # Manual binary selection - ALWAYS VISIBLE NOW
+        self.binary_selection_group = QGroupBox("Manual Binary Selection")
+        binary_layout = QVBoxLayout()
+        
+        self.binary_label = QLabel("If automatic detection fails or you prefer a different executable, select it manually:")
+        self.binary_label.setWordWrap(True)
+        
+        binary_button_layout = QHBoxLayout()
+        self.select_binary_btn = QPushButton("Select Executable...")
+        self.select_binary_btn.clicked.connect(self.select_binary_manually)
+        self.select_binary_btn.setEnabled(False)
+        self.select_binary_btn.setObjectName("secondary")
+        
+        self.clear_selection_btn = QPushButton("Clear")
+        self.clear_selection_btn.clicked.connect(self.clear_binary_selection)
+        self.clear_selection_btn.setEnabled(False)
+        self.clear_selection_btn.setObjectName("secondary")
+        
+        binary_button_layout.addWidget(self.select_binary_btn)
+        binary_button_layout.addWidget(self.clear_selection_btn)
+        binary_button_layout.addStretch()
+        
+        self.selected_binary_label = QLabel("")
+        self.selected_binary_label.setStyleSheet("padding: 4px; color: #1c71d8;")
+        
+        binary_layout.addWidget(self.binary_label)
+        binary_layout.addLayout(binary_button_layout)
+        binary_layout.addWidget(self.selected_binary_label)
+        self.binary_selection_group.setLayout(binary_layout)
+        self.binary_selection_group.setVisible(True)  # Always visible now
+        left_layout.addWidget(self.binary_selection_group)
+        
+        self.stats_label = QLabel("")
+        self.stats_label.setStyleSheet("color: #5e646b; font-size: 9pt; padding: 4px;")
+        left_layout.addWidget(self.stats_label)
+        
+        options_group = QGroupBox("Installation Options")
+        options_layout = QVBoxLayout()
+        
+        install_type_layout = QHBoxLayout()
+        install_type_layout.addWidget(QLabel("Install for:"))
+        self.user_radio = QRadioButton("Current User")
+        self.user_radio.setChecked(True)
+        self.system_radio = QRadioButton("All Users (Requires root)")
+        install_type_layout.addWidget(self.user_radio)
+        install_type_layout.addWidget(self.system_radio)
+        install_type_layout.addStretch()
+        options_layout.addLayout(install_type_layout)
+        
+        self.create_desktop_entry = QCheckBox("Create application menu entry")
+        self.create_desktop_entry.setChecked(True)
+        options_layout.addWidget(self.create_desktop_entry)
+        
+        # Option to show log after installation
+        self.show_log_checkbox = QCheckBox("Show installation log when complete")
+        self.show_log_checkbox.setChecked(self.settings.get('show_log_after_install', True))
+        self.show_log_checkbox.stateChanged.connect(self.on_log_preference_changed)
+        options_layout.addWidget(self.show_log_checkbox)
+        
+        options_group.setLayout(options_layout)
+        left_layout.addWidget(options_group)
+        
+        # Progress section
+        self.progress_group = QGroupBox("Installation Progress")
+        progress_layout = QVBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setTextVisible(True)
+        self.log_display = QTextEdit()
+        self.log_display.setReadOnly(True)
+        self.log_display.setMaximumHeight(120)
+        # The full text is kept in installation_log; the view only needs the tail
+        self.log_display.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(QLabel("Log:"))
+        progress_layout.addWidget(self.log_display)
+        self.progress_group.setLayout(progress_layout)
+        self.progress_group.setVisible(False)
+        left_layout.addWidget(self.progress_group)
+        
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_installation)
+        self.cancel_btn.setObjectName("secondary")
+        self.cancel_btn.setVisible(False)
+        self.install_btn = QPushButton("Install Application")
+        self.install_btn.clicked.connect(self.start_installation)
+        self.install_btn.setEnabled(False)
+        button_layout.addWidget(self.cancel_btn)
+        button_layout.addWidget(self.install_btn)
+        left_layout.addLayout(button_layout)
+        left_layout.addStretch()
+        
+        # Right panel - Analysis
+        right_panel = QWidget()
+        right_layout = QVBoxLayout(right_panel)
+        right_layout.setSpacing(12)
+        
+        analysis_group = QGroupBox("Package Analysis")
+        analysis_layout = QVBoxLayout()
+        
+        self.analysis_info_label = QLabel("No package analyzed yet.\nClick 'Analyze Package' to view contents.")
+        self.analysis_info_label.setWordWrap(True)
+        self.analysis_info_label.setStyleSheet("padding: 8px; background-color: #eff0f1; border-radius: 4px; min-height: 60px;")
+        analysis_layout.addWidget(self.analysis_info_label)
+        
+        self.contents_table = QTableWidget()
+        self.contents_table.setColumnCount(3)
+        self.contents_table.setHorizontalHeaderLabels(["Name", "Type", "Size"])
+        self.contents_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.contents_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.contents_table.horizontalHeader().setStretchLastSection(True)
+        self.contents_table.verticalHeader().setVisible(False)
+        analysis_layout.addWidget(self.contents_table, 1)
+        analysis_group.setLayout(analysis_layout)
+        right_layout.addWidget(analysis_group, 1)
+        
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(left_panel)
+        splitter.addWidget(right_panel)
+        splitter.setSizes([400, 400])
+        main_layout.addWidget(splitter)
+        
+        self.tab_widget.addTab(install_tab, "Install")
+        
+    def setup_manage_tab(self):
+        manage_tab = QWidget()
+        layout = QVBoxLayout(manage_tab)
+        
+        manage_group = QGroupBox("Installed Applications")
+        manage_layout = QVBoxLayout()
+        
+        manage_toolbar = QHBoxLayout()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh_apps_list)
+        refresh_btn.setObjectName("secondary")
+        scan_btn = QPushButton("Scan for Markers")
+        scan_btn.clicked.connect(self.scan_installations)
+        scan_btn.setObjectName("secondary")
+        self.uninstall_btn = QPushButton("Uninstall Selected")
+        self.uninstall_btn.clicked.connect(self.uninstall_application)
+        self.uninstall_btn.setEnabled(False)
+        self.uninstall_btn.setObjectName("danger")
+        self.remove_tracking_btn = QPushButton("Remove from Tracking")
+        self.remove_tracking_btn.clicked.connect(self.remove_from_tracking)
+        self.remove_tracking_btn.setEnabled(False)
+        self.remove_tracking_btn.setObjectName("secondary")
+        
+        manage_toolbar.addWidget(refresh_btn)
+        manage_toolbar.addWidget(scan_btn)
+        manage_toolbar.addStretch()
+        manage_toolbar.addWidget(self.remove_tracking_btn)
+        manage_toolbar.addWidget(self.uninstall_btn)
+        manage_layout.addLayout(manage_toolbar)
+        
+        # A view over one model, so a refresh is a model reset instead of an item per row
+        self.apps_model = InstallationsModel(self)
+        self.apps_list = QTreeView()
+        self.apps_list.setModel(self.apps_model)
+        self.apps_list.setRootIsDecorated(False)
+        self.apps_list.setUniformRowHeights(True)
+        self.apps_list.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.apps_list.setColumnWidth(0, 180)
+        self.apps_list.setColumnWidth(1, 80)
+        self.apps_list.setColumnWidth(2, 120)
+        self.apps_list.setColumnWidth(3, 60)
+        self.apps_list.selectionModel().selectionChanged.connect(self.on_app_selection_changed)
+        manage_layout.addWidget(self.apps_list)
+        manage_group.setLayout(manage_layout)
+        layout.addWidget(manage_group)
+        
+        # The tracker database and marker scan wait until the tab is opened
+        self.manage_loaded = False
+        self.manage_tab_index = self.tab_widget.addTab(manage_tab, "Manage")
+        
+    def setup_help_tab(self):
+        # Only an empty page is added here; the contents are built the
+        # first time the tab is shown
+        self.help_tab = QWidget()
+        self.help_built = False
+        self.help_tab_index = self.tab_widget.addTab(self.help_tab, "Help")
+        
+    def on_tab_changed(self, index):
+        if index == self.manage_tab_index and not self.manage_loaded:
+            self.load_tracked_installations()
+        elif index == self.help_tab_index and not self.help_built:
+            self.help_built = True
+            self.build_help_contents()
+        
+    def build_help_contents(self):
+        layout = QVBoxLayout(self.help_tab)
+        
+        help_group = QGroupBox("Help & Information")
+        help_layout = QVBoxLayout()
+        
+        help_text = QLabel(f"""
+        <div style='line-height: 1.6;'>
+        <h3>Tarball Installer v{__version__}</h3>
+        
+        <h4>Quick Start:</h4>
+        <ol>
+        <li>Go to <b>Install</b> tab and click <b>Browse for Tarball</b></li>
+        <li>Select your downloaded .tar.gz, .tar.bz2, or .tar.xz file</li>
+        <li>Click <b>Analyze Package</b> to see detailed contents</li>
+        <li>If no .desktop file exists, you can manually select the main executable</li>
+        <li>Choose installation options</li>
+        <li>Click <b>Install Application</b></li>
+        </ol>
+        
+        <h4>Key Features:</h4>
+        <ul>
+        <li><b>Manual Binary Selection:</b> Use file picker to select main executable when needed</li>
+        <li><b>Smart Analysis:</b> Shows all executables (with or without extensions)</li>
+        <li><b>System Integration:</b> Creates proper desktop entries</li>
+        <li><b>Mandatory Tracking:</b> Always creates marker files for uninstallation</li>
+        <li><b>Complete Uninstallation:</b> Removes all files and markers</li>
+        <li><b>Auto-detection:</b> Finds existing installations on startup</li>
+        </ul>
+        
+        <h4>Manual Binary Selection:</h4>
+        <p>If a package doesn't have a .desktop file, you'll need to manually select
+        the main executable. Since you've already tested the app from the extracted
+        tarball, you should know which file to run.</p>
+        
+        <p>Click <b>Select Executable</b> and navigate to the extracted folder to
+        choose the correct binary.</p>
+        
+        <h4>Marker Files:</h4>
+        <p>Marker files (<code>.tarball-installer-marker.json</code>) are always created
+        for tracking and are only removed during full uninstallation.</p>
+        
+        <h4>Extraction Cache:</h4>
+        <p>Packages are extracted under <code>~/.cache/tarball-installer/extracted/</code>
+        (or <code>$XDG_CACHE_HOME</code>), or in <code>/dev/shm</code> when that cache is on
+        another filesystem than <code>~/Applications</code>. A cancelled install keeps its
+        extraction so the next attempt can skip unpacking; extractions unused for
+        {EXTRACTION_CACHE_MAX_AGE // 86400} days are removed by the next install.
+        The directory can be deleted at any time.</p>
+        </div>
+        """)
+        help_text.setWordWrap(True)
+        
+        scroll = QScrollArea()
+        scroll.setWidget(help_text)
+        scroll.setWidgetResizable(True)
+        help_layout.addWidget(scroll)
+        help_group.setLayout(help_layout)
+        layout.addWidget(help_group)
+        
+    def load_tracked_installations(self):
+        self.manage_loaded = True
+        # A reset drops the selection without emitting selectionChanged
+        self.apps_model.set_installations(self.tracker.get_installations())
+        self.on_app_selection_changed()
+        # Saves happen in the background, so a failed one is reported here
+        if self.tracker.save_error is not None:
+            self.status_bar.showMessage(f"Could not save the installation database: {self.tracker.save_error}")
+        
+    def browse_file(self):
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select Tarball",
+            self.downloads_dir,
+            TARBALL_FILE_FILTER
+        )
+        
+        if file_path and self.extract_thread and self.extract_thread.isRunning():
+            self.status_bar.showMessage("Wait for the current extraction to finish")
+        elif file_path and self.install_running:
+            self.status_bar.showMessage("Wait for the current installation to finish")
+        elif file_path:
+            self.current_file = file_path
+            file_name = os.path.basename(file_path)
+            file_size = os.path.getsize(file_path) / (1024 * 1024)
+            
+            self.file_label.setText(f"📦 <b>{file_name}</b><br>Size: {file_size:.2f} MB")
+            self.analyze_btn.setEnabled(True)
+            self.install_btn.setEnabled(True)
+            self.select_binary_btn.setEnabled(True)  # Enable manual selection
+            self.status_bar.showMessage(f"Selected: {file_name}")
+            
+    def analyze_package(self):
+        if not self.current_file:
+            return
+        
+        # Clean up any previous temp directories (in case user selected a different file)
+        self.cleanup_temp_dirs()
+        
+        try:
+            self.contents_table.setRowCount(0)
+            self.detected_binaries = []
+            self.user_selected_binary = None
+            self.selected_binary_label.setText("")
+            self.analyzed_file = None
+            
+            # The info label is set once, with the summary, when the preview is done;
+            # until then the status bar and its progress label carry the news
+            self.status_bar.showMessage("Reading package contents...")
+            
+            # The preview only needs the headers; extraction waits for
+            # manual selection or the installer
+            self.start_worker(PreviewThread(self.current_file), "Reading", self.show_analysis)
+            
+        except Exception as e:
+            QMessageBox.warning(self, "Analysis Error", f"Could not analyze package:\n{str(e)}")    
+    
+    def show_analysis(self, success, message, total_members):
+        if not success:
+            QMessageBox.warning(self, "Analysis Error", f"Could not analyze package:\n{message}")
+            return
+        
+        try:
+            file_name = os.path.basename(self.current_file)
+            file_size = os.path.getsize(self.current_file) / (1024 * 1024)
+            preview = self.extract_thread
+            binaries = preview.binaries
+            desktop_files = preview.desktop_files
+            icons = preview.icons
+            
+            self.detected_binaries = binaries
+            self.analyzed_file = self.current_file
+            
+            # ALWAYS show manual selection section, but update text based on findings
+            if not desktop_files and binaries:
+                self.binary_label.setText("No .desktop file found. Please select the main executable manually.")
+            elif desktop_files and binaries:
+                self.binary_label.setText("Auto-detection found a .desktop file, but you can override the main executable manually if needed:")
+            else:
+                self.binary_label.setText("Select the main executable manually:")
+            
+            self.stats_label.setText(f"📊 Found: {len(desktop_files)} desktop entries, {len(binaries)} executables, {len(icons)} icons")
+            
+            # Display first 100 items; fill the table with repaints and item
+            # signals held off so the view updates once at the end
+            table = self.contents_table
+            table.setUpdatesEnabled(False)
+            table.setSortingEnabled(False)
+            table.blockSignals(True)
+            try:
+                table.setRowCount(len(preview.rows))
+                
+                for row, texts in enumerate(preview.rows):
+                    for column, text in enumerate(texts):
+                        table.setItem(row, column, QTableWidgetItem(text))
+            finally:
+                table.blockSignals(False)
+                table.setUpdatesEnabled(True)
+            
+            self.contents_table.resizeColumnsToContents()
+            self.analysis_info_label.setText(f"📦 <b>{file_name}</b><br>Size: {file_size:.2f} MB<br>Total items: {total_members}")
+            self.status_bar.showMessage(f"Analyzed: {total_members} items, {len(binaries)} executables")
+            
+        except Exception as e:
+            QMessageBox.warning(self, "Analysis Error", f"Could not analyze package:\n{str(e)}")
+    
+    def select_binary_manually(self):
+        """Simple file picker for manual binary selection - extracts only when needed"""
+        import tempfile
+        if not self.current_file:
+            QMessageBox.warning(self, "No File Selected", "Please select a tarball file first.")
+            return
+        
+        # A previous selection already extracted this tarball, so pick from that
+        if self.extracted_file == self.current_file and self.temp_analysis_dir and os.path.isdir(self.temp_analysis_dir):
+            self.choose_extracted_binary()
+            return
+        
+        # Ask user if they want to extract for manual selection
+        file_name = os.path.basename(self.current_file)
+        file_size = os.path.getsize(self.current_file) / (1024 * 1024)
+        
+        reply = QMessageBox.question(
+            self,
+            "Extract for Manual Selection",
+            f"To select a binary manually, the tarball needs to be extracted.\n\n"
+            f"File: {file_name}\n"
+            f"Size: {file_size:.1f} MB\n\n"
+            f"This will extract to a temporary location.\n"
+            f"Do you want to continue?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        
+        if reply != QMessageBox.Yes:
+            return
+        
+        # Clean up any previous temp dirs
+        self.cleanup_temp_dirs()
+        
+        # Create temp directory for extraction
+        self.temp_analysis_dir = tempfile.mkdtemp(prefix="tarball_select_")
+        self.status_bar.showMessage(f"Extracting {file_name}...")
+        
+        # Extract with progress
+        self.start_worker(ExtractThread(self.current_file, self.temp_analysis_dir),
+                          "Extracting", self.pick_extracted_binary)
+    
+    def pick_extracted_binary(self, success, message, total_members):
+        if not success:
+            QMessageBox.warning(self, "Extraction Error", f"Could not extract package for manual selection:\n{message}")
+            # Clean up on error
+            self.cleanup_temp_dirs()
+            return
+        
+        self.extracted_file = self.current_file
+        # The root is fixed once extraction is done; picking and installing reuse it
+        self.extracted_root = self.find_extraction_root(self.temp_analysis_dir)
+        self.choose_extracted_binary()
+    
+    def choose_extracted_binary(self):
+        try:
+            # Use the extracted directory
+            extracted_root = self.extracted_root
+            binary_path, _ = QFileDialog.getOpenFileName(
+                self,
+                "Select Main Executable",
+                extracted_root,
+                EXECUTABLE_FILE_FILTER
+            )
+            
+            if binary_path and os.path.exists(binary_path):
+                # Make it relative to the extraction root
+                try:
+                    rel_path = os.path.relpath(binary_path, extracted_root)
+                    self.user_selected_binary = rel_path
+                    self.selected_binary_label.setText(f"Selected: {os.path.basename(binary_path)}")
+                    self.clear_selection_btn.setEnabled(True)
+                    self.status_bar.showMessage(f"Selected: {os.path.basename(binary_path)}")
+                except ValueError as e:
+                    QMessageBox.warning(self, "Selection Error", f"Could not determine relative path: {str(e)}")
+            else:
+                self.status_bar.showMessage("No binary selected")
+                
+        except Exception as e:
+            QMessageBox.warning(self, "Extraction Error", f"Could not extract package for manual selection:\n{str(e)}")
+            # Clean up on error
+            self.cleanup_temp_dirs()
+
+    def start_worker(self, thread, action, on_finished):
+        """Run a preview or extraction of current_file off the GUI thread"""
+        # Nothing else may use temp_analysis_dir until the worker is done
+        self.set_package_actions_enabled(False)
+        
+        self.extract_thread = thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.extract_thread.progress.connect(
+            lambda progress: self.progress_label.setText(f"{action}: {progress}%"), queued)
+        self.extract_thread.finished.connect(self.extraction_finished, queued)
+        self.extract_thread.finished.connect(on_finished, queued)
+        self.extract_thread.start()
+    
+    def extraction_finished(self, success, message, total_members):
+        self.progress_label.clear()
+        if not self.install_running:
+            self.set_package_actions_enabled(True)
+    
+    def set_package_actions_enabled(self, enabled):
+        """Analyze, Select Binary and Install, which all work on temp_analysis_dir"""
+        for button in (self.analyze_btn, self.select_binary_btn, self.install_btn):
+            button.setEnabled(enabled)
+    
+    def find_extraction_root(self, temp_dir):
+        """Find the actual root directory where tarball contents were extracted"""
+        # List contents of temp_dir
+        items = os.listdir(temp_dir)
+        
+        # If there's only one item and it's a directory, that's likely the root
+        if len(items) == 1 and os.path.isdir(os.path.join(temp_dir, items[0])):
+            return os.path.join(temp_dir, items[0])
+        
+        # Otherwise, return the temp_dir itself
+        return temp_dir
+    
+    def cleanup_temp_dirs(self):
+        """Clean up temporary directories"""
+        if self.temp_analysis_dir:
+            # An install moves the extraction out, which usually leaves an empty
+            # directory that one rmdir removes; anything bigger goes to the pool
+            try:
+                os.rmdir(self.temp_analysis_dir)
+            except FileNotFoundError:
+                pass
+            except OSError:
+                QThreadPool.globalInstance().start(RemoveTreeTask(self.temp_analysis_dir))
+            self.temp_analysis_dir = None
+        self.extracted_file = None
+        self.extracted_root = None
+
+    def clear_binary_selection(self):
+        self.user_selected_binary = None
+        self.selected_binary_label.setText("")
+        self.clear_selection_btn.setEnabled(False)
+    
+    def start_installation(self):
+        if not self.current_file:
+            QMessageBox.warning(self, "No Package Selected", "Please select a tarball file first.")
+            return
+        
+        # Without an extracted directory the installer extracts the tarball itself,
+        # but the package still has to be analyzed first. The analysis extraction
+        # may be of a tarball selected earlier, and then it can't be used
+        extracted_dir = None
+        if self.extracted_file == self.current_file:
+            extracted_dir = self.temp_analysis_dir
+        if not extracted_dir and self.analyzed_file != self.current_file:
+            QMessageBox.warning(self, "Package Not Analyzed", "Please analyze the package first before installing.")
+            return
+        
+        # NEW: Reset installation log
+        self.installation_log = ""
+        self.log_display.clear()
+        self.pending_log_lines.pop(self.log_display, None)
+        self.last_progress = None
+        
+        selected_binary_for_installer = None
+        if self.user_selected_binary and extracted_dir:
+            # Convert relative path to absolute path in the extracted directory
+            selected_binary_for_installer = os.path.join(self.extracted_root, self.user_selected_binary)
+        
+        self.progress_group.setVisible(True)
+        self.progress_bar.setValue(0)
+        # The installer may be reading temp_analysis_dir until it finishes
+        self.install_running = True
+        self.set_package_actions_enabled(False)
+        # A late cancel of the previous install leaves the button disabled
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setVisible(True)
+        
+        install_type = "user" if self.user_radio.isChecked() else "system"
+        options = {
+            'install_type': install_type,
+            'create_desktop_entry': self.create_desktop_entry.isChecked()
+        }
+        
+        # THIS WAS MISSING - creating and starting the thread!
+        self.installer_thread = InstallerThread(
+            self.current_file,
+            options,
+            selected_binary_for_installer,
+            extracted_dir  # Pass the already-extracted directory, if any
+        )
+        # Queue explicitly so the worker never blocks on the GUI thread
+        queued = Qt.ConnectionType.QueuedConnection
+        self.installer_thread.progress.connect(self.update_progress, queued)
+        self.installer_thread.log.connect(self.update_log, queued)
+        # Record the install from the worker itself, so the tracker has it
+        # before the GUI hears about it
+        self.installer_thread.installed.connect(self.record_installation,
+                                                Qt.ConnectionType.DirectConnection)
+        self.installer_thread.finished.connect(self.installation_finished, queued)
+        self.installer_thread.start()
+        
+        self.status_bar.showMessage("Installing...")
+                
+    def update_progress(self, message, value):
+        # An exact repeat would only repaint the bar and log the same line again
+        if (message, value) == self.last_progress:
+            return
+        if not self.last_progress or value != self.last_progress[1]:
+            self.progress_bar.setValue(value)
+        self.last_progress = (message, value)
+        self.update_log(f"[{value}%] {message}")
+        
+    def update_log(self, message):
+        # Store in installation log
+        self.installation_log += message + "\n"
+        
+        # Display in UI
+        self.queue_log_line(self.log_display, message)
+    
+    def queue_log_line(self, display, message):
+        """Hold a line for display, appending everything queued in one go shortly after"""
+        self.pending_log_lines.setdefault(display, []).append(message)
+        if not self.log_flush_pending:
+            self.log_flush_pending = True
+            QTimer.singleShot(LOG_DISPLAY_INTERVAL_MS, self.flush_log_lines)
+    
+    def flush_log_lines(self):
+        self.log_flush_pending = False
+        pending, self.pending_log_lines = self.pending_log_lines, {}
+        for display, lines in pending.items():
+            # Append and scroll with painting off, then repaint the viewport once
+            display.setUpdatesEnabled(False)
+            try:
+                display.append('\n'.join(lines))
+                cursor = display.textCursor()
+                cursor.movePosition(cursor.MoveOperation.End)
+                display.setTextCursor(cursor)
+            finally:
+                display.setUpdatesEnabled(True)
+                display.viewport().update()
+        
+    def installation_finished(self, success, message, install_data):
+        # Clean up temp directory after installation (success or failure)
+        self.cleanup_temp_dirs()
+        
+        # A cancel that came too late leaves real failures to be reported as such
+        if not success and self.installer_thread.stopped:
+            self.installation_cancelled()
+            return
+        
+        # The worker usually reported 100% just before finishing
+        if not self.last_progress or self.last_progress[1] != 100:
+            self.progress_bar.setValue(100)
+        
+        if success:
+            self.update_log("✓ Installation completed successfully!")
+            self.update_log("✓ Marker file created for tracking")
+            
+            self.load_tracked_installations()
+            
+            main_binary = install_data.get('main_binary')
+            binary_info = f"\nExecutable: {os.path.basename(main_binary)}" if main_binary else ""
+            
+            # Show success message
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle("Installation Complete")
+            msg_box.setText(f"Application installed successfully!{binary_info}\n\nYou can now find it in your application menu.")
+            
+            # Add "Show Log" button if user wants to see it
+            if self.settings.get('show_log_after_install', True):
+                show_log_btn = msg_box.addButton("Show Installation Log", QMessageBox.ActionRole)
+                msg_box.addButton("OK", QMessageBox.AcceptRole)
+            else:
+                msg_box.addButton("OK", QMessageBox.AcceptRole)
+            
+            msg_box.exec()
+            
+            # Check which button was clicked
+            if self.settings.get('show_log_after_install', True) and msg_box.clickedButton() == show_log_btn:
+                self.show_installation_log()
+            
+            self.status_bar.showMessage("Installation completed successfully")
+        else:
+            self.update_log(f"✗ Error: {message}")
+            
+            # Always show log on error
+            msg_box = QMessageBox(self)
+            msg_box.setWindowTitle("Installation Failed")
+            msg_box.setText(f"Installation failed:\n{message}")
+            msg_box.setIcon(QMessageBox.Critical)
+            
+            show_log_btn = msg_box.addButton("Show Error Log", QMessageBox.ActionRole)
+            msg_box.addButton("OK", QMessageBox.AcceptRole)
+            
+            msg_box.exec()
+            
+            if msg_box.clickedButton() == show_log_btn:
+                self.show_installation_log()
+            
+            self.status_bar.showMessage("Installation failed")
+        
+        # Clear installation log for next time
+        self.installation_log = ""
+        
+        self.install_running = False
+        self.set_package_actions_enabled(True)
+        self.cancel_btn.setVisible(False)
+
+    def cancel_installation(self):
+        if self.installer_thread is not None and self.installer_thread.isRunning():
+            # The worker stops at its next checkpoint and reports back through finished
+            self.installer_thread.cancel()
+            self.cancel_btn.setEnabled(False)
+            if self.installer_thread.installing:
+                self.finishing_installation()
+                return
+            self.status_bar.showMessage("Cancelling installation...")
+            thread = self.installer_thread
+            QTimer.singleShot(CANCEL_TIMEOUT_MS, lambda: self.force_cancel_installation(thread))
+    
+    def force_cancel_installation(self, thread):
+        """Kill a cancelled worker that is stuck between checkpoints"""
+        if thread is not self.installer_thread or not thread.isRunning():
+            return
+        # Holding the lock keeps the worker from starting the install while it is killed
+        with thread.commit_lock:
+            if thread.installing:
+                self.finishing_installation()
+                return
+            thread.terminate()
+            thread.wait()
+        self.cleanup_temp_dirs()
+        self.installation_cancelled()
+    
+    def finishing_installation(self):
+        # Too late to cancel: stopping now would leave a half-installed app
+        self.status_bar.showMessage("Finishing installation...")
+        self.update_log("Files are already being installed; finishing the install")
+    
+    def installation_cancelled(self):
+        self.update_log("⏹ Installation cancelled")
+        self.install_running = False
+        self.set_package_actions_enabled(True)
+        self.cancel_btn.setEnabled(True)
+        self.cancel_btn.setVisible(False)
+        self.status_bar.showMessage("Installation cancelled")
+            
+    def scan_installations(self):
+        # A tracker created just now has already scanned for markers
+        if self._tracker is not None:
+            self.tracker.scan_existing_installations()
+        self.load_tracked_installations()
+        count = len(self.tracker.get_installations())
+        self.status_bar.showMessage(f"Found {count} tracked installations")
+        QMessageBox.information(self, "Scan Complete", f"Found {count} installations.")
+    
+    def cleanup_markers(self):
+        total_found, removed_count = self.tracker.cleanup_orphaned_markers()
+        if total_found > 0:
+            self.status_bar.showMessage(f"Cleaned up {removed_count}/{total_found} orphaned markers")
+            QMessageBox.information(self, "Cleanup Complete", f"Removed {removed_count} orphaned markers.")
+        else:
+            self.status_bar.showMessage("No orphaned markers found")
+            QMessageBox.information(self, "Cleanup Complete", "No orphaned markers found.")
+    
+    def selected_installation(self):
+        """(app_id, app_name) of the selected row, or None"""
+        rows = self.apps_list.selectionModel().selectedRows()
+        if not rows:
+            return None
+        texts, app_id = self.apps_model.rows[rows[0].row()]
+        return app_id, texts[0]
+    
+    def on_app_selection_changed(self):
+        # Only whether anything is selected matters, not which rows
+        has_selection = self.apps_list.selectionModel().hasSelection()
+        self.uninstall_btn.setEnabled(has_selection)
+        self.remove_tracking_btn.setEnabled(has_selection)
+
+    def show_installation_log(self):
+        """Show installation log in a dialog"""
+        dialog = InstallationLogDialog(self.installation_log, self)
+        dialog.exec()        
+        
+    def uninstall_application(self):
+        selected = self.selected_installation()
+        if not selected:
+            return
+            
+        app_id, app_name = selected
+        
+        install_data = self.tracker.get_installation_by_id(app_id)
+        if not install_data:
+            QMessageBox.warning(self, "Cannot Uninstall", f"No installation data found for '{app_name}'.")
+            return
+        
+        # open() returns at once; the answer arrives through finished, so no
+        # nested event loop runs while the question is up
+        box = QMessageBox(QMessageBox.Warning, "Confirm Uninstallation",
+                          f"Are you sure you want to completely uninstall '{app_name}'?\n\n"
+                          "This will remove all files, markers, and desktop entries.\n"
+                          "This action cannot be undone!",
+                          QMessageBox.Yes | QMessageBox.No, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.finished.connect(lambda result: self.uninstall_confirmed(box, install_data, app_name))
+        box.open()
+    
+    def uninstall_confirmed(self, box, install_data, app_name):
+        button = box.clickedButton()
+        if button is None or box.standardButton(button) != QMessageBox.Yes:
+            return
+        
+        self.uninstall_thread = UninstallThread(install_data)
+        self.uninstall_thread.progress.connect(self.update_uninstall_progress)
+        self.uninstall_thread.log.connect(self.update_uninstall_log)
+        self.uninstall_thread.finished.connect(self.uninstallation_finished)
+        
+        self.ensure_uninstall_dialog()
+        self.uninstall_dialog.setWindowTitle(f"Uninstalling {app_name}")
+        self.uninstall_label.setText(f"Uninstalling {app_name}...")
+        self.uninstall_progress.setValue(0)
+        self.last_uninstall_progress = None
+        self.pending_log_lines.pop(self.uninstall_log_display, None)
+        self.uninstall_log_display.clear()
+        self.uninstall_dialog.show()
+        self.uninstall_thread.start()
+    
+    def ensure_uninstall_dialog(self):
+        """Build the uninstall progress dialog once; later uninstalls reuse it"""
+        if self.uninstall_dialog is not None:
+            return
+        self.uninstall_dialog = QDialog(self)
+        self.uninstall_dialog.setFixedSize(500, 300)
+        layout = QVBoxLayout(self.uninstall_dialog)
+        self.uninstall_label = QLabel()
+        layout.addWidget(self.uninstall_label)
+        self.uninstall_progress = QProgressBar()
+        layout.addWidget(self.uninstall_progress)
+        self.uninstall_log_display = QTextEdit()
+        self.uninstall_log_display.setReadOnly(True)
+        self.uninstall_log_display.document().setMaximumBlockCount(LOG_MAX_BLOCKS)
+        layout.addWidget(self.uninstall_log_display)
+    
+    def update_uninstall_progress(self, message, value):
+        if self.uninstall_progress is not None:
+            # The uninstaller reports every file, mostly at an unchanged percentage
+            if (message, value) == self.last_uninstall_progress:
+                return
+            if not self.last_uninstall_progress or value != self.last_uninstall_progress[1]:
+                self.uninstall_progress.setValue(value)
+            self.last_uninstall_progress = (message, value)
+            self.update_uninstall_log(f"[{value}%] {message}")
+    
+    def update_uninstall_log(self, message):
+        if self.uninstall_log_display is not None:
+            self.queue_log_line(self.uninstall_log_display, message)
+    
+    def uninstallation_finished(self, success, message):
+        if self.uninstall_dialog is not None:
+            self.uninstall_dialog.accept()
+        
+        if success:
+            selected = self.selected_installation()
+            if selected:
+                app_id, _ = selected
+                self.tracker.remove_installation(app_id)
+                self.load_tracked_installations()
+            
+            QMessageBox.information(self, "Uninstallation Complete", message)
+            self.status_bar.showMessage("Application uninstalled successfully")
+        else:
+            QMessageBox.critical(self, "Uninstallation Failed", message)
+            self.status_bar.showMessage("Uninstallation failed")
+            
+    def remove_from_tracking(self):
+        selected = self.selected_installation()
+        if not selected:
+            return
+            
+        app_id, app_name = selected
+        
+        reply = QMessageBox.question(self, "Remove from Tracking",
+                                   f"Remove '{app_name}' from tracking?\n\n"
+                                   "This will remove from database but keep files.\n"
+                                   "Will be redetected on scan.",
+                                   QMessageBox.Yes | QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            self.tracker.remove_installation(app_id)
+            self.load_tracked_installations()
+            self.status_bar.showMessage(f"Removed from tracking: {app_name}")
+        
+    def refresh_apps_list(self):
+        self.load_tracked_installations()
+        self.status_bar.showMessage("Refreshed application list")
+        
+    def show_about_dialog(self):
+        QMessageBox.about(self, "About Tarball Installer", ABOUT_TEXT)
+
+    def view_last_log(self):
+        """View the last installation log"""
+        if not self.installation_log:
+            QMessageBox.information(self, "No Log", "No installation log available.")
+            return
+        
+        dialog = InstallationLogDialog(self.installation_log, self)
+        dialog.exec()        
+
+    def closeEvent(self, event):
+        """Clean up when window closes"""
+        if self.extract_thread and self.extract_thread.isRunning():
+            self.extract_thread.cancel()
+            self.extract_thread.wait()
+        self.cleanup_temp_dirs()
+        # Let pending deletions finish before the process exits, but with
+        # the window already gone so closing feels instant
+        self.hide()
+        QThreadPool.globalInstance().waitForDone()
+        if self._tracker is not None:
+            error = self._tracker.flush()
+            if error is not None:
+                QMessageBox.warning(self, "Tracking Not Saved",
+                                    f"Recent changes to the installation database could not be saved:\n{error}")
+        event.accept()        
\ No newline at end of file